@@ -274,7 +274,7 @@ class GeneralPurposeAgent:
         self.router = MetaRouter(api_client, config.get("model_router", "gpt-4o-mini"))
         self.compressor = ContextCompressor(api_client, config, scratchpad)
         self.gateway = ExecutionGateway(scratchpad)
-        self.executor = ToolExecutor(scratchpad, config, status_callback=self.status_cb)
+        self.executor = ToolExecutor(scratchpad, config, status_callback=status_callback)
         self.firewall = FirewallManager()
 
     def _strip_nonlimit_status_banner(self, text: str) -> str:
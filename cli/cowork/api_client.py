@@ -21,6 +21,34 @@ class APIError(Exception):
         self.status_code = status_code
 
 
+# id-tuple of a tool list → (the list, its serialized JSON). Tool schemas are
+# static for the process, so the category-stripped JSON is built once per
+# distinct list; holding the list keeps those ids from being reused.
+_TOOLS_JSON_CACHE: dict[tuple, tuple[list, str]] = {}
+_TOOLS_JSON_CACHE_MAX = 32
+
+
+def _tools_json(tools: list[dict]) -> str:
+    key = tuple(map(id, tools))
+    hit = _TOOLS_JSON_CACHE.get(key)
+    if hit is not None:
+        return hit[1]
+    # Strip non-standard 'category' field if present (e.g. for Google AI compatibility)
+    out = json.dumps([{k: v for k, v in t.items() if k != "category"} for t in tools])
+    if len(_TOOLS_JSON_CACHE) >= _TOOLS_JSON_CACHE_MAX:
+        _TOOLS_JSON_CACHE.clear()
+    _TOOLS_JSON_CACHE[key] = (list(tools), out)
+    return out
+
+
+def _encode_payload(payload: dict, tools: Optional[list[dict]]) -> bytes:
+    """Request body with the cached tools JSON spliced in instead of re-serialized."""
+    body = json.dumps(payload)
+    if tools:
+        body = f'{body[:-1]}, "tools": {_tools_json(tools)}}}'
+    return body.encode("utf-8")
+
+
 class APIClient:
     """
     Async HTTP client for OpenAI-compatible inference endpoints.
@@ -98,17 +126,12 @@ class APIClient:
             "max_tokens": max_tokens,
         }
         if tools:
-            # Strip non-standard 'category' field if present (e.g. for Google AI compatibility)
-            clean_tools = []
-            for t in tools:
-                ct = t.copy()
-                ct.pop("category", None)
-                clean_tools.append(ct)
-            payload["tools"] = clean_tools
             payload["tool_choice"] = tool_choice
         if response_format:
             payload["response_format"] = response_format
 
+        body = _encode_payload(payload, tools)
+
         # 1. Throttle
         await self._throttle()
 
@@ -116,7 +139,7 @@ class APIClient:
         for attempt in range(self.max_retries):
             try:
                 client = self._get_client()
-                resp = await client.post(f"{self.endpoint}chat/completions", json=payload)
+                resp = await client.post(f"{self.endpoint}chat/completions", content=body)
                 if resp.status_code == 429:
                     # Rate limit — back off with jitter
                     import random
@@ -186,15 +209,10 @@ class APIClient:
             "stream": True,
         }
         if tools:
-            # Strip non-standard 'category' field if present (e.g. for Google AI compatibility)
-            clean_tools = []
-            for t in tools:
-                ct = t.copy()
-                ct.pop("category", None)
-                clean_tools.append(ct)
-            payload["tools"] = clean_tools
             payload["tool_choice"] = tool_choice
 
+        body = _encode_payload(payload, tools)
+
         # 1. Throttle
         await self._throttle()
 
@@ -203,7 +221,7 @@ class APIClient:
         finish_reason = "stop"
 
         client = self._get_client()
-        async with client.stream("POST", "chat/completions", json=payload) as resp:
+        async with client.stream("POST", "chat/completions", content=body) as resp:
             if resp.status_code >= 400:
                 body = await resp.aread()
                 raise APIError(f"Stream error {resp.status_code}: {body.decode()}", resp.status_code)
@@ -70,6 +70,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
     # Vision / Image analysis
     "mm_vision_endpoint":         "",
     "mm_vision_model":            "",
+    "mm_vision_local":            False,  # run loopback vision models in-process
     # Image generation
     "mm_image_endpoint":          "",
     "mm_image_model":             "",
@@ -121,6 +122,7 @@ class ConfigManager:
     def __init__(self) -> None:
         load_dotenv()
         self._data: dict[str, Any] = {}
+        self.version = 0  # bumped on every set() so callers can cache derived values
         self._load()
 
     def _load(self) -> None:
@@ -179,6 +181,7 @@ class ConfigManager:
 
     def set(self, key: str, value: Any) -> None:
         self._data[key] = value
+        self.version += 1
         self.save()
 
     def all(self) -> dict[str, Any]:
@@ -291,6 +294,10 @@ class Session:
 
 
 # ─── Scratchpad ───────────────────────────────────────────────────────────────
+# Words indexed for scratchpad search; runs of these chars are never split by a query
+_SEARCH_TOKEN_RE = re.compile(r"[a-z0-9_]{3,}")
+
+
 class Scratchpad:
     """
     Pass-by-Reference memory system.
@@ -302,6 +309,9 @@ class Scratchpad:
         self._dir = SCRATCHPAD_DIR / session_id
         self._dir.mkdir(exist_ok=True)
         self._index: dict[str, dict] = {}
+        self._lc_cache: dict[str, str] = {}  # key → lowercased content, for search
+        self._tokens: dict[str, set[str]] = {}  # token → keys containing it
+        self._vocab: dict[str, str] = {}  # key → its distinct tokens, newline-joined
         self._load_index()
 
     def _index_path(self) -> Path:
@@ -322,6 +332,7 @@ class Scratchpad:
         ref_key = f"ref:{key}"
         path = self._dir / f"{key}.txt"
         path.write_text(content, encoding="utf-8")
+        self._index_text(key, content.lower())
         self._index[key] = {
             "key": key,
             "description": description,
@@ -333,16 +344,31 @@ class Scratchpad:
         return ref_key
 
     def get(self, key: str) -> Optional[str]:
-        """Retrieve full content by key."""
-        clean_key = key.replace("ref:", "")
-        path = self._dir / f"{clean_key}.txt"
+        """Retrieve full content by key (with or without 'ref:' prefix)."""
+        if key.startswith("ref:"):
+            key = key[4:]
+        return self._read(key)
+
+    def _read(self, key: str) -> Optional[str]:
+        path = self._dir / f"{key}.txt"
         if path.exists():
             return path.read_text(encoding="utf-8")
         return None
 
+    def _read_head(self, key: str, n: int) -> str:
+        """First `n` characters of stored content, without reading the rest."""
+        try:
+            with open(self._dir / f"{key}.txt", encoding="utf-8") as f:
+                return f.read(n)
+        except OSError:
+            return ""
+
     def read_chunk(self, key: str, chunk_index: int = 0, chunk_size: int = 2000) -> Optional[str]:
-        """Read a specific chunk of stored content."""
-        content = self.get(key)
+        """
+        Read a specific chunk of stored content.
+        `key` must be the bare key — callers strip any 'ref:' prefix first.
+        """
+        content = self._read(key)
         if content is None:
             return None
         start = chunk_index * chunk_size
@@ -351,17 +377,63 @@ class Scratchpad:
         total_chunks = (len(content) + chunk_size - 1) // chunk_size
         return f"[Chunk {chunk_index + 1}/{total_chunks}]\n{chunk}"
 
+    @property
+    def count(self) -> int:
+        """Number of stored items (O(1), no disk access)."""
+        return len(self._index)
+
+    def meta(self, key: str) -> Optional[dict]:
+        """Index entry for `key` (a fresh dict per save), or None."""
+        return self._index.get(key)
+
     def list_all(self) -> list[dict]:
         return list(self._index.values())
 
-    def search(self, query: str) -> list[dict]:
-        """Simple text search across stored items."""
+    def _index_text(self, key: str, lc: str) -> str:
+        """Cache lowercased content for `key` and (re)build its token postings."""
+        for tok in self._vocab.get(key, "").split("\n"):
+            self._tokens.get(tok, set()).discard(key)
+        toks = set(_SEARCH_TOKEN_RE.findall(lc))
+        for tok in toks:
+            self._tokens.setdefault(tok, set()).add(key)
+        self._vocab[key] = "\n".join(toks)
+        self._lc_cache[key] = lc
+        return lc
+
+    def search(self, query: str, preview_chars: int = 200) -> list[dict]:
+        """
+        Case-insensitive substring search across stored items.
+        Lowercased content is cached per key, so repeat searches skip the
+        disk read + lower() pass; only matching items are re-read for preview.
+        Single-word queries are answered from the token index: an exact token
+        hit is an O(1) posting lookup, otherwise only the item's distinct
+        words are scanned rather than its full content.
+        Previews are capped at `preview_chars` and only the file prefix they
+        need is read back from disk.
+        """
         results = []
         query_lower = query.lower()
+        word = _SEARCH_TOKEN_RE.fullmatch(query_lower) is not None
+        exact = self._tokens.get(query_lower, ()) if word else ()
         for key, meta in self._index.items():
-            content = self.get(key) or ""
-            if query_lower in content.lower() or query_lower in meta.get("description", "").lower():
-                results.append({**meta, "preview": content[:200]})
+            lc = self._lc_cache.get(key)
+            if lc is None:
+                lc = self._index_text(key, (self._read(key) or "").lower())
+            if word and key not in exact and query_lower not in self._vocab[key]:
+                idx = -1
+            else:
+                idx = lc.find(query_lower)
+            if idx < 0 and query_lower not in meta.get("description", "").lower():
+                continue
+            lead = preview_chars // 5
+            end = idx - lead + preview_chars if idx > lead else preview_chars
+            head = self._read_head(key, end)
+            # Offsets into lc only line up with the content if lower() kept lengths
+            if idx >= 0 and len(head.lower()) == len(head):
+                preview = head[max(0, idx - lead):end]
+            else:
+                preview = head[:preview_chars]
+            results.append({**meta, "preview": preview})
         return results
 
     def resolve_refs(self, text: str) -> str:
@@ -388,6 +460,9 @@ class Scratchpad:
         shutil.rmtree(self._dir, ignore_errors=True)
         self._dir.mkdir(exist_ok=True)
         self._index = {}
+        self._lc_cache = {}
+        self._tokens = {}
+        self._vocab = {}
 
 
 # ─── Job Manager ─────────────────────────────────────────────────────────────
@@ -459,13 +459,11 @@ async def handle_command(
             if loaded:
                 render_success(f"📂 Loaded session: '{loaded.title}' ({len(loaded.messages)} messages)")
                 # Try to link workspace session
-                for ws_info in workspace_manager.list_all():
-                    if ws_info["session_id"] == loaded.session_id:
-                        ws = WorkspaceSession.load(ws_info["slug"])
-                        if ws:
-                            loaded._ws = ws
-                            render_success(f"📂 Workspace: workspace/{ws.slug}/")
-                        break
+                ws_slug = workspace_manager.get_slug_by_session_id(loaded.session_id)
+                ws = WorkspaceSession.load(ws_slug) if ws_slug else None
+                if ws:
+                    loaded._ws = ws
+                    render_success(f"📂 Workspace: workspace/{ws.slug}/")
                 return True, loaded, False
             else:
                 render_error(f"Session '{target}' not found.")
@@ -1099,13 +1097,11 @@ def chat(session_id: Optional[str], no_banner: bool, trace: Optional[bool]) -> N
             render_error(f"Session '{session_id}' not found.")
             session = Session(title="New Session")
         # Try to link workspace session
-        for ws_info in workspace_manager.list_all():
-            if ws_info["session_id"] == session.session_id:
-                ws = WorkspaceSession.load(ws_info["slug"])
-                if ws:
-                    session._ws = ws
-                    console.print(f"  [dim_text]📂 Workspace: workspace/{ws.slug}/[/dim_text]")
-                break
+        ws_slug = workspace_manager.get_slug_by_session_id(session.session_id)
+        ws = WorkspaceSession.load(ws_slug) if ws_slug else None
+        if ws:
+            session._ws = ws
+            console.print(f"  [dim_text]📂 Workspace: workspace/{ws.slug}/[/dim_text]")
     else:
         session = Session(title="New Session")
         session.save()
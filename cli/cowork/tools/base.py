@@ -7,6 +7,10 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Callable
 
 
+def _noop_status(msg: str) -> None:
+    pass
+
+
 class BaseTool(ABC):
     """
     Base class for all Cowork tools.
@@ -19,7 +23,7 @@ class BaseTool(ABC):
         scratchpad: Any = None,
         config: Any = None,
     ) -> None:
-        self.status_callback = status_callback or (lambda msg: None)
+        self.status_callback = status_callback or _noop_status
         self.scratchpad = scratchpad
         self.config = config
 
@@ -27,6 +31,16 @@ class BaseTool(ABC):
         """Helper to send status updates back to the UI."""
         self.status_callback(msg)
 
+    @property
+    def has_emit_listener(self) -> bool:
+        """False when nobody consumes status updates, so callers can skip building them."""
+        return self.status_callback is not _noop_status
+
+    def _emit_lazy(self, make_msg: Callable[[], str]) -> None:
+        """Like _emit, but only formats the message when a listener is attached."""
+        if self.status_callback is not _noop_status:
+            self.status_callback(make_msg())
+
     @property
     @abstractmethod
     def name(self) -> str:
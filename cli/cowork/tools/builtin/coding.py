@@ -61,11 +61,10 @@ def _workspace_session_code_root(scratchpad: Any = None) -> Optional[Path]:
     if not session_id:
         return None
     try:
-        for info in workspace_manager.list_all():
-            if info.get("session_id") == session_id:
-                ws = WorkspaceSession.load(info["slug"])
-                if ws:
-                    return ws.artifacts_path / "codebase"
+        slug = workspace_manager.get_slug_by_session_id(session_id)
+        ws = WorkspaceSession.load(slug) if slug else None
+        if ws:
+            return ws.artifacts_path / "codebase"
     except Exception:
         return None
     return None
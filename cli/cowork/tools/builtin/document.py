@@ -24,12 +24,12 @@ from ...workspace import workspace_manager, WORKSPACE_ROOT
 def _get_artifacts_dir(scratchpad) -> Path:
     """Return the workspace artifacts/ path, falling back to WORKSPACE_ROOT."""
     if scratchpad:
-        for info in workspace_manager.list_all():
-            if info["session_id"] == scratchpad.session_id:
-                from ...workspace import WorkspaceSession
-                ws = WorkspaceSession.load(info["slug"])
-                if ws:
-                    return ws.artifacts_path
+        slug = workspace_manager.get_slug_by_session_id(scratchpad.session_id)
+        if slug:
+            from ...workspace import WorkspaceSession
+            ws = WorkspaceSession.load(slug)
+            if ws:
+                return ws.artifacts_path
     return WORKSPACE_ROOT
 
 
@@ -38,6 +38,10 @@ def _safe_filename(name: str) -> str:
     return Path(name).name
 
 
+# Escape XML special chars for ReportLab paragraphs
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
 # ─── PDF ─────────────────────────────────────────────────────────────────────
 
 class DocumentCreatePdfTool(BaseTool):
@@ -98,7 +102,7 @@ class DocumentCreatePdfTool(BaseTool):
             from reportlab.lib import colors
             from reportlab.platypus import (
                 SimpleDocTemplate, Paragraph, Spacer,
-                ListFlowable, ListItem, HRFlowable,
+                ListFlowable, HRFlowable,
             )
         except ImportError:
             return "❌ reportlab not installed. Run: pip install reportlab"
@@ -174,15 +178,11 @@ class DocumentCreatePdfTool(BaseTool):
             if heading:
                 story.append(Paragraph(heading, h1_style))
             if text:
-                # Escape XML special chars for ReportLab
-                safe_text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                story.append(Paragraph(safe_text, body_style))
+                story.append(Paragraph(text.translate(_XML_ESCAPE), body_style))
             if bullets:
-                items = [
-                    ListItem(Paragraph(b.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"), bullet_style))
-                    for b in bullets
-                ]
-                story.append(ListFlowable(items, bulletType="bullet", start="•", leftIndent=18))
+                # ListFlowable wraps bare flowables itself — no ListItem needed
+                bullet_paras = [Paragraph(b.translate(_XML_ESCAPE), bullet_style) for b in bullets]
+                story.append(ListFlowable(bullet_paras, bulletType="bullet", start="•", leftIndent=18))
             story.append(Spacer(1, 3 * mm))
 
         doc.build(story)
@@ -264,7 +264,7 @@ class DocumentCreatePptxTool(BaseTool):
         self._emit(f"📊 Creating PPTX: '{filename}'...")
         try:
             from pptx import Presentation
-            from pptx.util import Inches, Pt, Emu
+            from pptx.util import Inches, Pt
             from pptx.dml.color import RGBColor
             from pptx.enum.text import PP_ALIGN
         except ImportError:
@@ -286,8 +286,9 @@ class DocumentCreatePptxTool(BaseTool):
             if len(h) == 3:
                 h = "".join(c * 2 for c in h)
             try:
-                return RGBColor(int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
-            except Exception:
+                r, g, b = bytes.fromhex(h)
+                return RGBColor(r, g, b)
+            except ValueError:
                 return RGBColor(0x1A, 0x1A, 0x2E)
 
         accent = _rgb(theme_color)
@@ -301,7 +302,6 @@ class DocumentCreatePptxTool(BaseTool):
         blank_layout = prs.slide_layouts[6]  # blank
 
         def _add_rect(slide, left, top, width, height, fill_rgb):
-            from pptx.util import Emu
             shape = slide.shapes.add_shape(
                 1,  # MSO_SHAPE_TYPE.RECTANGLE
                 Inches(left), Inches(top), Inches(width), Inches(height)
@@ -354,16 +354,15 @@ class DocumentCreatePptxTool(BaseTool):
                 y_offset += 1.4
 
             if bullets:
-                from pptx.util import Pt as _Pt
                 bullet_box = sl.shapes.add_textbox(Inches(0.5), Inches(y_offset), Inches(12.33), Inches(7.5 - y_offset - 0.3))
                 tf = bullet_box.text_frame
                 tf.word_wrap = True
                 for idx, bullet in enumerate(bullets):
                     p = tf.add_paragraph() if idx > 0 else tf.paragraphs[0]
                     p.text = f"  •  {bullet}"
-                    p.space_before = _Pt(6)
+                    p.space_before = Pt(6)
                     for run in p.runs:
-                        run.font.size = _Pt(18)
+                        run.font.size = Pt(18)
                         run.font.color.rgb = dark_text
 
         prs.save(str(out_path))
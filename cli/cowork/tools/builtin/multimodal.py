@@ -30,11 +30,34 @@ API Design (OpenAI-compatible):
   POST /v1/audio/speech             — Text-to-Speech (TTS)
 """
 
+import atexit
 import base64
+import hashlib
 import json
 import mimetypes
+import mmap
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+try:
+    import orjson  # optional: 3-5x faster parsing of large b64/transcript payloads
+except ImportError:
+    orjson = None
+
+try:
+    import blake3  # optional: SIMD tree hashing for cache keys
+except ImportError:
+    blake3 = None
 
 from ..base import BaseTool
 from .utility import sanitize_for_audio
@@ -43,18 +66,43 @@ from ...workspace import workspace_manager, WORKSPACE_ROOT
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
+_artifacts_dirs: Dict[str, Path] = {}  # session_id → artifacts path
+
+
 def _get_artifacts_dir(scratchpad) -> Path:
-    """Return the workspace artifacts/ path, falling back to WORKSPACE_ROOT."""
+    """
+    Return the workspace artifacts/ path, falling back to WORKSPACE_ROOT.
+    Resolved paths are memoized per session and revalidated with a single stat,
+    so renamed or deleted workspaces fall through to a fresh lookup.
+    """
     if scratchpad:
-        for info in workspace_manager.list_all():
-            if info["session_id"] == scratchpad.session_id:
-                from ...workspace import WorkspaceSession
-                ws = WorkspaceSession.load(info["slug"])
-                if ws:
-                    return ws.artifacts_path
+        session_id = scratchpad.session_id
+        cached = _artifacts_dirs.get(session_id)
+        if cached is not None and cached.is_dir():
+            return cached
+        slug = workspace_manager.get_slug_by_session_id(session_id)
+        if slug:
+            from ...workspace import WorkspaceSession
+            ws = WorkspaceSession.load(slug)
+            if ws:
+                _artifacts_dirs[session_id] = ws.artifacts_path
+                return ws.artifacts_path
     return WORKSPACE_ROOT
 
 
+# Known upload types — avoids mimetypes' database load + URL parse for the common cases
+_MIME = {
+    ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png",
+    ".gif": "image/gif", ".webp": "image/webp",
+    ".mp3": "audio/mpeg", ".wav": "audio/wav", ".m4a": "audio/mp4",
+    ".flac": "audio/flac", ".ogg": "audio/ogg", ".webm": "audio/webm",
+}
+
+
+def _guess_mime(p: Path, default: str) -> str:
+    return _MIME.get(p.suffix.lower()) or mimetypes.guess_type(p)[0] or default
+
+
 def _safe_filename(name: str) -> str:
     """Strip path traversal, keep only the base name."""
     return Path(name).name
@@ -69,68 +117,375 @@ def _cfg(config, key: str, fallback: str = "", global_key: str = "") -> str:
     """
     if config is None:
         return fallback
-    
-    # 1. Try specific MM key
-    val = str(config.get(key, "")).strip()
-    
+
+    # 1. Try specific MM key (config values are almost always str already)
+    val = config.get(key, "")
+    val = val.strip() if val.__class__ is str else str(val).strip()
+    if val:
+        return val
+
     # 2. Try global fallback if MM key is empty
-    if not val and global_key:
-        val = str(config.get(global_key, "")).strip()
-        
+    if global_key:
+        val = config.get(global_key, "")
+        val = val.strip() if val.__class__ is str else str(val).strip()
+
     return val or fallback
 
 
+class _MMConfigMixin:
+    """
+    Resolves a tool's `_CONFIG_KEYS` once per config version instead of on every
+    execute(). ConfigManager bumps `version` on set(); configs without a version
+    (plain dicts) are re-resolved each call.
+    """
+    _CONFIG_KEYS: Dict[str, tuple] = {}  # attr → (key, fallback, global_key)
+    _mm_cfg: Optional[tuple] = None
+
+    def _mm_config(self) -> Dict[str, str]:
+        version = getattr(self.config, "version", None)
+        cached = self._mm_cfg
+        if cached is not None and version is not None and cached[0] == version:
+            return cached[1]
+        values = {attr: _cfg(self.config, *spec) for attr, spec in self._CONFIG_KEYS.items()}
+        self._mm_cfg = (version, values)
+        return values
+
+
+# ─── Response Cache ───────────────────────────────────────────────────────────
+# Vision / ASR results keyed by (file content hash, model, prompt/language, endpoint).
+# Hot entries live in an in-memory LRU; all entries are mirrored to disk so
+# repeated questions about the same file survive across sessions.
+
+_MM_CACHE_DIR = Path.home() / ".cowork" / "mm_cache"
+_MM_CACHE_MAX = 256
+_MM_CACHE_TTL = 86400 * 7
+_MM_HASH_LIMIT = 32 * 1024 * 1024  # don't hash (or cache) files larger than this
+
+_mm_cache: "OrderedDict[str, dict]" = OrderedDict()
+_mm_cache_lock = threading.Lock()  # tools run concurrently in executor threads
+
+
+_MMAP_MIN = 1024 * 1024  # below this a plain read is cheaper than mapping
+
+
+def _file_digest(p: Path) -> Optional[str]:
+    """
+    Return a content hash of the file, or None if it is too large to cache.
+    Uses BLAKE3 when installed (BLAKE2b otherwise) and hashes large files
+    through a read-only mmap so the contents are never copied into Python.
+    """
+    size = p.stat().st_size
+    if size > _MM_HASH_LIMIT:
+        return None
+    h = blake3.blake3() if blake3 else hashlib.blake2b(digest_size=16)
+    with p.open("rb") as f:
+        if size >= _MMAP_MIN:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        else:
+            h.update(f.read())
+    return h.hexdigest(16) if blake3 else h.hexdigest()
+
+
+def _mm_cache_key(digest: str, *parts: str) -> str:
+    return hashlib.sha1("\0".join((digest, *parts)).encode()).hexdigest()
+
+
+def _mm_cache_get(key: str) -> Optional[dict]:
+    with _mm_cache_lock:
+        if key in _mm_cache:
+            _mm_cache.move_to_end(key)
+            return _mm_cache[key]
+    path = _MM_CACHE_DIR / f"{key}.json"
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if time.time() - data["ts"] < _MM_CACHE_TTL:
+            _mm_cache_put(key, data["value"], persist=False)
+            return data["value"]
+    except Exception:
+        pass
+    return None
+
+
+def _mm_cache_put(key: str, value: dict, persist: bool = True) -> None:
+    with _mm_cache_lock:
+        _mm_cache[key] = value
+        _mm_cache.move_to_end(key)
+        while len(_mm_cache) > _MM_CACHE_MAX:
+            _mm_cache.popitem(last=False)
+    if persist:
+        try:
+            _MM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (_MM_CACHE_DIR / f"{key}.json").write_text(
+                json.dumps({"ts": time.time(), "value": value}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        except Exception:
+            pass
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_pretty(obj: Any) -> str:
+    """Indented JSON for diagnostic output."""
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# Shared HTTP clients — reused across calls so TCP/TLS handshakes are amortized.
+# HTTP/2 (multiplexed uploads over one connection) is used when the optional `h2`
+# package is installed; hosts that reject it are pinned to an HTTP/1.1 client.
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_clients: Dict[bool, httpx.Client] = {}  # http2 flag → client
+_http1_hosts: set = set()
+
+
+def _get_client(url: str = "") -> httpx.Client:
+    """Return the pooled httpx.Client for `url`, creating it on first use."""
+    http2 = _HTTP2 and urlparse(url).hostname not in _http1_hosts
+    client = _clients.get(http2)
+    if client is None or client.is_closed:
+        client = _clients[http2] = httpx.Client(
+            timeout=120,
+            transport=httpx.HTTPTransport(
+                http2=http2,
+                retries=1,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            ),
+        )
+        atexit.register(client.close)
+    return client
+
+
+def _downgrade_to_http1(url: str) -> bool:
+    """Pin `url`'s host to HTTP/1.1 after a protocol error. Returns True if a retry makes sense."""
+    host = urlparse(url).hostname
+    if not _HTTP2 or host in _http1_hosts:
+        return False
+    _http1_hosts.add(host)
+    return True
+
+
+def _post(url: str, **kwargs: Any) -> httpx.Response:
+    try:
+        return _get_client(url).post(url, **kwargs)
+    except httpx.RemoteProtocolError:
+        if not _downgrade_to_http1(url):
+            raise
+        for _, fh, _ in kwargs.get("files", {}).values():
+            fh.seek(0)
+        return _get_client(url).post(url, **kwargs)
+
+
 def _post_json(endpoint: str, token: str, path: str, payload: dict) -> dict:
     """
     Synchronous HTTP POST with JSON body — used for image generation and TTS
     where we receive JSON back. Returns parsed response dict.
     Raises RuntimeError on HTTP or network errors.
     """
-    import httpx
     url = endpoint.rstrip("/") + path
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    with httpx.Client(timeout=120) as client:
-        resp = client.post(url, json=payload, headers=headers)
+    resp = _post(url, json=payload, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:300]}")
-    return resp.json()
+    return _json_loads(resp.content)
 
 
-def _post_multipart(endpoint: str, token: str, path: str, fields: dict, file_bytes: bytes, filename: str, mime: str) -> dict:
+def _post_multipart(endpoint: str, token: str, path: str, fields: dict, file_obj: BinaryIO, filename: str, mime: str) -> dict:
     """
     Synchronous multipart/form-data POST — used for vision (image file) and ASR (audio file).
+    The file is streamed from `file_obj` in chunks rather than loaded into memory.
     Returns parsed JSON response.
     Raises RuntimeError on HTTP or network errors.
     """
-    import httpx
     url = endpoint.rstrip("/") + path
     headers = {"Authorization": f"Bearer {token}"}
-    files = {"file": (filename, file_bytes, mime)}
-    with httpx.Client(timeout=120) as client:
-        resp = client.post(url, data=fields, files=files, headers=headers)
+    files = {"file": (filename, file_obj, mime)}
+    resp = _post(url, data=fields, files=files, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:300]}")
-    return resp.json()
+    return _json_loads(resp.content)
 
 
-def _post_binary(endpoint: str, token: str, path: str, payload: dict) -> bytes:
+def _post_binary_stream(endpoint: str, token: str, path: str, payload: dict, out_path: Path) -> None:
     """
-    Synchronous HTTP POST returning raw bytes — used for TTS audio download.
+    Synchronous HTTP POST streaming the raw response body to `out_path` —
+    used for TTS audio download. Peak memory stays at one chunk.
     Raises RuntimeError on HTTP or network errors.
     """
-    import httpx
     url = endpoint.rstrip("/") + path
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    with httpx.Client(timeout=120) as client:
-        resp = client.post(url, json=payload, headers=headers)
-    if resp.status_code != 200:
-        raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:300]}")
-    return resp.content
+    try:
+        with _get_client(url).stream("POST", url, json=payload, headers=headers) as resp:
+            if resp.status_code != 200:
+                resp.read()
+                raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:300]}")
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with out_path.open("wb") as f:
+                    for chunk in resp.iter_bytes(chunk_size=65536):
+                        f.write(chunk)
+            except BaseException:
+                out_path.unlink(missing_ok=True)
+                raise
+    except httpx.RemoteProtocolError:
+        if not _downgrade_to_http1(url):
+            raise
+        _post_binary_stream(endpoint, token, path, payload, out_path)
+
+
+# ─── Local Vision Backend ─────────────────────────────────────────────────────
+
+_LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def _is_loopback(endpoint: str) -> bool:
+    try:
+        return urlparse(endpoint).hostname in _LOOPBACK_HOSTS
+    except ValueError:
+        return False
+
+
+class _LocalVision:
+    """
+    In-process vision backend, used only when mm_vision_local is enabled and
+    mm_vision_endpoint points at localhost (a local server may apply its own prompt
+    template, quantisation or revision, so bypassing it is the user's call).
+    Only engages if `transformers` is installed and the model's weights are already
+    in the local Hugging Face cache (never downloads). Pipelines are cached per model,
+    so only the first call pays the load cost. Any failure falls back to HTTP.
+    """
+    _pipelines: Dict[str, Any] = {}
+    _unavailable: set = set()
+    _lock = threading.Lock()  # concurrent tool calls must not load a model twice
+
+    @classmethod
+    def get(cls, model: str) -> Optional[Any]:
+        if model in cls._unavailable:
+            return None
+        pipe = cls._pipelines.get(model)
+        if pipe is not None:
+            return pipe
+        with cls._lock:
+            if model in cls._unavailable:
+                return None
+            pipe = cls._pipelines.get(model)
+            if pipe is None:
+                try:
+                    from huggingface_hub import try_to_load_from_cache  # type: ignore
+                    if not isinstance(try_to_load_from_cache(model, "config.json"), str):
+                        raise LookupError(model)
+                    from transformers import pipeline  # type: ignore
+                    pipe = pipeline("image-to-text", model=model)
+                except Exception:
+                    cls._unavailable.add(model)
+                    return None
+                cls._pipelines[model] = pipe
+        return pipe
+
+    @classmethod
+    def describe(cls, model: str, image_path: Path, prompt: str) -> Optional[dict]:
+        """Return an OpenAI-style `{"text": ...}` result, or None to use HTTP."""
+        pipe = cls.get(model)
+        if pipe is None:
+            return None
+        try:
+            out = pipe(str(image_path), prompt=prompt)
+            return {"text": out[0]["generated_text"]}
+        except Exception:
+            return None
+
+
+_B64_CHUNK = 65536  # multiple of 4: once stripped, each slice decodes independently
+# Non-alphabet characters (e.g. the newlines of line-wrapped payloads), which
+# b64decode discards; removed up front so slice boundaries stay 4-aligned
+_B64_JUNK_RE = re.compile(r"[^A-Za-z0-9+/=]+")
+
+
+def _write_b64(b64: str, out_path: Path) -> None:
+    """
+    Decode a base64 string to `out_path` slice by slice, never holding the full image.
+    On a decode or write error the partial file is removed and the error re-raised.
+    """
+    b64 = _B64_JUNK_RE.sub("", b64)
+    try:
+        with out_path.open("wb") as f:
+            for i in range(0, len(b64), _B64_CHUNK):
+                f.write(base64.b64decode(b64[i:i + _B64_CHUNK]))
+    except BaseException:
+        out_path.unlink(missing_ok=True)
+        raise
+
+
+def _decode_image(job: tuple) -> Optional[str]:
+    """Run one _write_b64 job; returns an error description instead of raising."""
+    b64, out_path = job
+    try:
+        _write_b64(b64, out_path)
+    except (ValueError, OSError) as e:  # binascii.Error is a ValueError
+        return f"{out_path.name}: {e}"
+    return None
+
+
+# ─── Generated Image Cache ────────────────────────────────────────────────────
+# Complete b64 runs are stored by (prompt, model, size, n, endpoint). Generation is
+# non-deterministic, so the cache is only read when the caller passes
+# reuse_cached=true. Evicted oldest-first above 2 GB.
+
+_IMG_CACHE_DIR = _MM_CACHE_DIR / "images"
+_IMG_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+
+def _image_cache_get(key: str) -> list:
+    entry = _IMG_CACHE_DIR / key
+    if not entry.is_dir():
+        return []
+    files = sorted(entry.glob("*.png"))
+    if files:
+        os.utime(entry)  # mark as recently used
+    return files
+
+
+def _image_cache_put(key: str, paths: list) -> None:
+    entry = _IMG_CACHE_DIR / key
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        for i, src in enumerate(paths):
+            shutil.copyfile(src, entry / f"{i}.png")
+        _image_cache_evict()
+    except OSError:
+        pass
+
+
+def _image_cache_evict() -> None:
+    entries = []
+    total = 0
+    for entry in _IMG_CACHE_DIR.iterdir():
+        size = sum(f.stat().st_size for f in entry.iterdir())
+        entries.append((entry.stat().st_mtime, size, entry))
+        total += size
+    for _, size, entry in sorted(entries):
+        if total <= _IMG_CACHE_MAX_BYTES:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
 
 
 # ─── Vision / Image Analysis ─────────────────────────────────────────────────
 
-class VisionAnalyzeTool(BaseTool):
+class VisionAnalyzeTool(_MMConfigMixin, BaseTool):
     """
     Analyse an image file using a vision-capable model.
 
@@ -140,6 +495,13 @@ class VisionAnalyzeTool(BaseTool):
         prompt  — instruction / question about the image
     """
 
+    _CONFIG_KEYS = {
+        "endpoint": ("mm_vision_endpoint", "", "api_endpoint"),
+        "token":    ("mm_vision_token", "", "api_key"),
+        "model":    ("mm_vision_model", "gpt-4o", "model_text"),
+        "local":    ("mm_vision_local", "", ""),
+    }
+
     @property
     def name(self) -> str:
         return "vision_analyze"
@@ -176,8 +538,8 @@ class VisionAnalyzeTool(BaseTool):
         }
 
     def execute(self, file_path: str, prompt: str = "Describe this image in detail.") -> str:
-        endpoint = _cfg(self.config, "mm_vision_endpoint", global_key="api_endpoint")
-        token    = _cfg(self.config, "mm_vision_token",    global_key="api_key")
+        cfg = self._mm_config()
+        endpoint, token = cfg["endpoint"], cfg["token"]
         
         if not endpoint or not token:
             return (
@@ -185,47 +547,64 @@ class VisionAnalyzeTool(BaseTool):
                 "[HINT]: Set mm_vision_endpoint or ensure your main AI provider is active."
             )
 
-        model = _cfg(self.config, "mm_vision_model", fallback="gpt-4o", global_key="model_text")
-        self._emit(f"👁️  Analyzing image: '{Path(file_path).name}'...")
+        model = cfg["model"]
 
         # Resolve file path
         p = Path(file_path)
+        pname = p.name
+        self._emit(f"👁️  Analyzing image: '{pname}'...")
         if not p.is_absolute():
             p = WORKSPACE_ROOT / file_path
         if not p.exists():
             return f"❌ File not found: {p}"
 
-        file_bytes = p.read_bytes()
-        mime = mimetypes.guess_type(str(p))[0] or "image/jpeg"
-
-        try:
-            result = _post_multipart(
-                endpoint=endpoint,
-                token=token,
-                path="/v1/recognize",
-                fields={"model": model, "prompt": prompt},
-                file_bytes=file_bytes,
-                filename=p.name,
-                mime=mime,
-            )
-        except RuntimeError as e:
-            return f"❌ Vision API error: {e}"
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
+        digest = _file_digest(p)
+        cache_key = _mm_cache_key(digest, "vision", model, prompt, endpoint) if digest else None
+        result = _mm_cache_get(cache_key) if cache_key else None
+
+        if result is None and _is_loopback(endpoint) and cfg["local"].lower() in ("1", "true", "yes", "on"):
+            # Separate cache key: in-process output may differ from the server's
+            local_key = _mm_cache_key(digest, "vision-local", model, prompt, endpoint) if digest else None
+            result = _mm_cache_get(local_key) if local_key else None
+            if result is None:
+                result = _LocalVision.describe(model, p, prompt)
+                if result is not None and local_key:
+                    _mm_cache_put(local_key, result)
+
+        if result is None:
+            mime = _guess_mime(p, "image/jpeg")
+
+            try:
+                with p.open("rb") as fh:
+                    result = _post_multipart(
+                        endpoint=endpoint,
+                        token=token,
+                        path="/v1/recognize",
+                        fields={"model": model, "prompt": prompt},
+                        file_obj=fh,
+                        filename=pname,
+                        mime=mime,
+                    )
+            except RuntimeError as e:
+                return f"❌ Vision API error: {e}"
+            except Exception as e:
+                return f"❌ Unexpected error: {e}"
+            if cache_key:
+                _mm_cache_put(cache_key, result)
 
         # Extract text from response (OpenAI-style or vendor-specific)
         text = (
             result.get("text")  # simple flat response
             or result.get("content")
             or (result.get("choices", [{}])[0].get("message", {}).get("content", ""))
-            or json.dumps(result, indent=2)
+            or _json_pretty(result)
         )
-        return f"🖼️  Vision Analysis — `{p.name}`\n\n{text}"
+        return f"🖼️  Vision Analysis — `{pname}`\n\n{text}"
 
 
 # ─── Image Generation ─────────────────────────────────────────────────────────
 
-class ImageGenerateTool(BaseTool):
+class ImageGenerateTool(_MMConfigMixin, BaseTool):
     """
     Generate an image from a text prompt.
 
@@ -233,6 +612,12 @@ class ImageGenerateTool(BaseTool):
     artifacts folder. Returns the saved file path.
     """
 
+    _CONFIG_KEYS = {
+        "endpoint": ("mm_image_endpoint", "", "api_endpoint"),
+        "token":    ("mm_image_token", "", "api_key"),
+        "model":    ("mm_image_model", "dall-e-3", ""),
+    }
+
     @property
     def name(self) -> str:
         return "image_generate"
@@ -274,6 +659,20 @@ class ImageGenerateTool(BaseTool):
                     "type": "string",
                     "description": "Optional prefix for saved files, e.g. 'banner'. Files are saved as prefix_0.png, etc.",
                 },
+                "fill_missing": {
+                    "type": "boolean",
+                    "description": (
+                        "If the backend returns fewer than n images (some models only make one per request), "
+                        "request the rest one by one. Each extra request is billed separately. Default: false."
+                    ),
+                },
+                "reuse_cached": {
+                    "type": "boolean",
+                    "description": (
+                        "Return previously generated images for an identical request (same prompt, model, "
+                        "size and n) instead of generating new ones. Default: false."
+                    ),
+                },
             },
             "required": ["prompt"],
         }
@@ -285,9 +684,11 @@ class ImageGenerateTool(BaseTool):
         size: str = "1024x1024",
         response_format: str = "b64_json",
         filename_prefix: str = "generated",
+        fill_missing: bool = False,
+        reuse_cached: bool = False,
     ) -> str:
-        endpoint = _cfg(self.config, "mm_image_endpoint", global_key="api_endpoint")
-        token    = _cfg(self.config, "mm_image_token",    global_key="api_key")
+        cfg = self._mm_config()
+        endpoint, token = cfg["endpoint"], cfg["token"]
         
         if not endpoint or not token:
             return (
@@ -295,10 +696,31 @@ class ImageGenerateTool(BaseTool):
                 "[HINT]: Set mm_image_endpoint or ensure your main AI provider is active."
             )
 
-        model = _cfg(self.config, "mm_image_model", fallback="dall-e-3")
+        model = cfg["model"]
         n = max(1, min(n, 10))
         response_format = response_format if response_format in ("url", "b64_json") else "b64_json"
 
+        artifacts_dir = _get_artifacts_dir(self.scratchpad)
+        safe_prefix = _safe_filename(filename_prefix) or "generated"
+
+        cache_key = None
+        if response_format == "b64_json":
+            cache_key = _mm_cache_key("image", prompt, model, size, str(n), endpoint)
+            cached = _image_cache_get(cache_key) if reuse_cached else []
+            # Entries written before short runs were excluded may hold fewer than n
+            if len(cached) == n:
+                self._emit(f"🎨 Reusing {len(cached)} cached image(s)...")
+                saved_paths = []
+                for i, src in enumerate(cached):
+                    out_path = artifacts_dir / f"{safe_prefix}_{i}.png"
+                    shutil.copyfile(src, out_path)
+                    saved_paths.append(str(out_path))
+                lines = [f"✅ Image generation complete (cached) — model: `{model}`"]
+                lines.append(f"• Saved {len(saved_paths)} file(s):")
+                for p in saved_paths:
+                    lines.append(f"  - `{p}`")
+                return "\n".join(lines)
+
         self._emit(f"🎨 Generating {n} image(s) with {model}...")
 
         payload: dict = {
@@ -317,24 +739,47 @@ class ImageGenerateTool(BaseTool):
             return f"❌ Unexpected error: {e}"
 
         images = result.get("data", [])
+
+        # Some backends (e.g. dall-e-3) only return one image per request. Extra
+        # requests are billable, so they are only made when the caller asks.
+        missing = n - len(images)
+        fill_errors = []
+        if images and missing > 0 and fill_missing:
+            single = {**payload, "n": 1}
+            with ThreadPoolExecutor(max_workers=min(missing, 8)) as pool:
+                futures = [
+                    pool.submit(_post_json, endpoint, token, "/v1/images/generations", single)
+                    for _ in range(missing)
+                ]
+                for fut in futures:
+                    try:
+                        images.extend(fut.result().get("data", []))
+                    except Exception as e:
+                        fill_errors.append(str(e))
+
         if not images:
-            return f"❌ No images returned. Full response:\n{json.dumps(result, indent=2)}"
+            return f"❌ No images returned. Full response:\n{_json_pretty(result)}"
 
-        artifacts_dir = _get_artifacts_dir(self.scratchpad)
-        saved_paths = []
+        to_decode = []
         urls = []
 
         for i, img in enumerate(images):
             if response_format == "b64_json" and img.get("b64_json"):
-                raw = base64.b64decode(img["b64_json"])
-                safe_prefix = _safe_filename(filename_prefix) or "generated"
-                fname = f"{safe_prefix}_{i}.png"
-                out_path = artifacts_dir / fname
-                out_path.write_bytes(raw)
-                saved_paths.append(str(out_path))
+                to_decode.append((img["b64_json"], artifacts_dir / f"{safe_prefix}_{i}.png"))
             elif img.get("url"):
                 urls.append(img["url"])
 
+        # Decode + write images in parallel so file I/O overlaps across images
+        with ThreadPoolExecutor(max_workers=max(1, min(len(to_decode), 8))) as pool:
+            decode_results = list(pool.map(_decode_image, to_decode))
+        saved_paths = [str(out_path) for (_, out_path), err in zip(to_decode, decode_results) if err is None]
+        decode_errors = [err for err in decode_results if err is not None]
+        if decode_errors and not saved_paths and not urls:
+            return "❌ Could not decode the returned image data:\n" + "\n".join(f"  - {e}" for e in decode_errors)
+        # Only complete runs are stored, so a short run is never replayed as the answer
+        if cache_key and len(saved_paths) == n:
+            _image_cache_put(cache_key, saved_paths)
+
         lines = [f"✅ Image generation complete — model: `{model}`"]
         if saved_paths:
             lines.append(f"• Saved {len(saved_paths)} file(s):")
@@ -344,15 +789,27 @@ class ImageGenerateTool(BaseTool):
             lines.append(f"• Image URL(s):")
             for u in urls:
                 lines.append(f"  - {u}")
+        if len(images) < n:
+            lines.append(f"⚠️ Backend returned {len(images)} of {n} requested image(s).")
+            if not fill_missing:
+                lines.append("  Pass fill_missing=true to request the rest individually (each is a separate billed call).")
+        if fill_errors:
+            lines.append(f"❌ {len(fill_errors)} extra request(s) failed:")
+            for e in fill_errors:
+                lines.append(f"  - {e}")
+        if decode_errors:
+            lines.append(f"❌ Could not decode {len(decode_errors)} image(s):")
+            for e in decode_errors:
+                lines.append(f"  - {e}")
         if not saved_paths and not urls:
-            lines.append(f"• Raw response:\n{json.dumps(result, indent=2)}")
+            lines.append(f"• Raw response:\n{_json_pretty(result)}")
 
         return "\n".join(lines)
 
 
 # ─── Speech-to-Text (ASR / Transcription) ────────────────────────────────────
 
-class SpeechToTextTool(BaseTool):
+class SpeechToTextTool(_MMConfigMixin, BaseTool):
     """
     Transcribe an audio file to text using a Whisper-compatible ASR service.
 
@@ -362,6 +819,12 @@ class SpeechToTextTool(BaseTool):
         language  — optional ISO-639-1 language code
     """
 
+    _CONFIG_KEYS = {
+        "endpoint": ("mm_asr_endpoint", "", "api_endpoint"),
+        "token":    ("mm_asr_token", "", "api_key"),
+        "model":    ("mm_asr_model", "whisper-1", ""),
+    }
+
     @property
     def name(self) -> str:
         return "speech_to_text"
@@ -396,8 +859,8 @@ class SpeechToTextTool(BaseTool):
         }
 
     def execute(self, file_path: str, language: str = "") -> str:
-        endpoint = _cfg(self.config, "mm_asr_endpoint", global_key="api_endpoint")
-        token    = _cfg(self.config, "mm_asr_token",    global_key="api_key")
+        cfg = self._mm_config()
+        endpoint, token = cfg["endpoint"], cfg["token"]
         
         if not endpoint or not token:
             return (
@@ -405,7 +868,7 @@ class SpeechToTextTool(BaseTool):
                 "[HINT]: Set mm_asr_endpoint or ensure your main AI provider is active."
             )
 
-        model = _cfg(self.config, "mm_asr_model", fallback="whisper-1")
+        model = cfg["model"]
 
         # Resolve file path
         p = Path(file_path)
@@ -414,35 +877,43 @@ class SpeechToTextTool(BaseTool):
         if not p.exists():
             return f"❌ File not found: {p}"
 
-        self._emit(f"🎤 Transcribing audio: '{p.name}'...")
-
-        file_bytes = p.read_bytes()
-        mime = mimetypes.guess_type(str(p))[0] or "audio/mpeg"
-
-        fields: dict = {"model": model}
-        if language:
-            fields["language"] = language
-
-        try:
-            result = _post_multipart(
-                endpoint=endpoint,
-                token=token,
-                path="/v1/audio/transcriptions",
-                fields=fields,
-                file_bytes=file_bytes,
-                filename=p.name,
-                mime=mime,
-            )
-        except RuntimeError as e:
-            return f"❌ ASR API error: {e}"
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
-
-        text = result.get("text", "") or json.dumps(result, indent=2)
+        pname = p.name
+        self._emit(f"🎤 Transcribing audio: '{pname}'...")
+
+        digest = _file_digest(p)
+        cache_key = _mm_cache_key(digest, "asr", model, language, endpoint) if digest else None
+        result = _mm_cache_get(cache_key) if cache_key else None
+
+        if result is None:
+            mime = _guess_mime(p, "audio/mpeg")
+
+            fields: dict = {"model": model}
+            if language:
+                fields["language"] = language
+
+            try:
+                with p.open("rb") as fh:
+                    result = _post_multipart(
+                        endpoint=endpoint,
+                        token=token,
+                        path="/v1/audio/transcriptions",
+                        fields=fields,
+                        file_obj=fh,
+                        filename=pname,
+                        mime=mime,
+                    )
+            except RuntimeError as e:
+                return f"❌ ASR API error: {e}"
+            except Exception as e:
+                return f"❌ Unexpected error: {e}"
+            if cache_key:
+                _mm_cache_put(cache_key, result)
+
+        text = result.get("text", "") or _json_pretty(result)
         duration = result.get("duration")
         lang_detected = result.get("language", language or "auto")
 
-        lines = [f"🎤 Transcription — `{p.name}`"]
+        lines = [f"🎤 Transcription — `{pname}`"]
         if duration:
             lines.append(f"• Duration: {duration:.1f}s | Language: {lang_detected}")
         lines.append("")
@@ -452,13 +923,20 @@ class SpeechToTextTool(BaseTool):
 
 # ─── Text-to-Speech (TTS) ─────────────────────────────────────────────────────
 
-class TextToSpeechTool(BaseTool):
+class TextToSpeechTool(_MMConfigMixin, BaseTool):
     """
     Convert text to speech audio using a TTS service.
 
     Calls POST /v1/audio/speech and saves the audio to the workspace artifacts folder.
     """
 
+    _CONFIG_KEYS = {
+        "endpoint": ("mm_tts_endpoint", "", "api_endpoint"),
+        "token":    ("mm_tts_token", "", "api_key"),
+        "model":    ("mm_tts_model", "tts-1", ""),
+        "voice":    ("mm_tts_voice", "", ""),
+    }
+
     @property
     def name(self) -> str:
         return "text_to_speech"
@@ -509,8 +987,8 @@ class TextToSpeechTool(BaseTool):
         filename: str = "",
         voice: str = "",
     ) -> str:
-        endpoint = _cfg(self.config, "mm_tts_endpoint", global_key="api_endpoint")
-        token    = _cfg(self.config, "mm_tts_token",    global_key="api_key")
+        cfg = self._mm_config()
+        endpoint, token = cfg["endpoint"], cfg["token"]
         
         if not endpoint or not token:
             return (
@@ -518,8 +996,8 @@ class TextToSpeechTool(BaseTool):
                 "[HINT]: Set mm_tts_endpoint or ensure your main AI provider is active."
             )
 
-        model = _cfg(self.config, "mm_tts_model", fallback="tts-1")
-        forced_voice = _cfg(self.config, "mm_tts_voice", fallback="")
+        model = cfg["model"]
+        forced_voice = cfg["voice"]
         valid_formats = ("mp3", "opus", "aac", "flac", "wav", "pcm")
         response_format = response_format if response_format in valid_formats else "mp3"
         source_text = (input or "").strip() or (input_ref or "").strip()
@@ -536,14 +1014,7 @@ class TextToSpeechTool(BaseTool):
             "response_format": response_format,
         }
 
-        try:
-            audio_bytes = _post_binary(endpoint, token, "/v1/audio/speech", payload)
-        except RuntimeError as e:
-            return f"❌ TTS API error: {e}"
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
-
-        # Save to workspace artifacts
+        # Stream straight into the workspace artifacts folder
         artifacts_dir = _get_artifacts_dir(self.scratchpad)
         if filename:
             safe_name = _safe_filename(filename)
@@ -551,16 +1022,21 @@ class TextToSpeechTool(BaseTool):
             if not safe_name.endswith(f".{response_format}"):
                 safe_name = f"{Path(safe_name).stem}.{response_format}"
         else:
-            import time as _time
-            safe_name = f"speech_{int(_time.time())}.{response_format}"
+            safe_name = f"speech_{int(time.time())}.{response_format}"
 
         out_path = artifacts_dir / safe_name
-        out_path.write_bytes(audio_bytes)
+        try:
+            _post_binary_stream(endpoint, token, "/v1/audio/speech", payload, out_path)
+        except RuntimeError as e:
+            return f"❌ TTS API error: {e}"
+        except Exception as e:
+            return f"❌ Unexpected error: {e}"
+
         size_kb = out_path.stat().st_size // 1024
 
         return (
             f"✅ TTS audio generated!\n"
-            f"• File: `{out_path.name}`\n"
+            f"• File: `{safe_name}`\n"
             f"• Path: `{out_path}`\n"
             f"• Size: {size_kb} KB\n"
             f"• Voice: {forced_voice} | Model: {model} | Format: {response_format}\n"
@@ -6,134 +6,103 @@ Tools for managing session-specific scratchpad data.
 from typing import Any, Dict, Optional
 from ..base import BaseTool
 
+_EMPTY_MSG = "Scratchpad is empty."
+_LIST_HEADER = "Scratchpad contents:\n\n"
+
+
+def _trunc(s: str, n: int = 60) -> str:
+    return s if len(s) <= n else s[:n] + "..."
+
+
 class ScratchpadSaveTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "scratchpad_save"
-
-    @property
-    def description(self) -> str:
-        return "Save large data to the session scratchpad. Returns a ref:key pointer."
-
-    @property
-    def category(self) -> str:
-        return "SESSION_SCRATCHPAD"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "key": {"type": "string", "description": "Unique key for this data (alphanumeric + underscore)"},
-                "content": {"type": "string", "description": "The content to store"},
-                "description": {"type": "string", "description": "Brief description of what is stored"},
-            },
-            "required": ["key", "content"],
-        }
+    name = "scratchpad_save"
+    description = "Save large data to the session scratchpad. Returns a ref:key pointer."
+    category = "SESSION_SCRATCHPAD"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "key": {"type": "string", "description": "Unique key for this data (alphanumeric + underscore)"},
+            "content": {"type": "string", "description": "The content to store"},
+            "description": {"type": "string", "description": "Brief description of what is stored"},
+        },
+        "required": ["key", "content"],
+    }
 
     def execute(self, key: str, content: str, description: str = "") -> str:
-        self._emit(f"💾 Saving to scratchpad: '{key}'...")
+        self._emit_lazy(lambda: f"💾 Saving to scratchpad: '{key}'...")
         if not self.scratchpad:
             return "❌ Error: Scratchpad not initialized."
         ref = self.scratchpad.save(key, content, description)
         return f"Saved to scratchpad. Reference: {ref} ({len(content)} chars)"
 
 class ScratchpadListTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "scratchpad_list"
-
-    @property
-    def description(self) -> str:
-        return "List all items currently stored in the scratchpad."
-
-    @property
-    def category(self) -> str:
-        return "SESSION_SCRATCHPAD"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {"type": "object", "properties": {}, "required": []}
+    name = "scratchpad_list"
+    description = "List all items currently stored in the scratchpad."
+    category = "SESSION_SCRATCHPAD"
+    parameters: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
 
     def execute(self) -> str:
         self._emit("📋 Listing scratchpad contents...")
         if not self.scratchpad:
             return "❌ Error: Scratchpad not initialized."
+        if not self.scratchpad.count:
+            return _EMPTY_MSG
         items = self.scratchpad.list_all()
-        if not items:
-            return "Scratchpad is empty."
-        lines = ["Scratchpad contents:\n"]
-        for item in items:
-            lines.append(f"• ref:{item['key']} — {item['description'] or 'No description'} ({item['size_chars']} chars)")
-        return "\n".join(lines)
+        return _LIST_HEADER + "\n".join(
+            f"• ref:{item['key']} — {item['description'] or 'No description'} ({item['size_chars']} chars)"
+            for item in items
+        )
 
 class ScratchpadReadChunkTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "scratchpad_read_chunk"
-
-    @property
-    def description(self) -> str:
-        return "Read a specific chunk of scratchpad content by key."
-
-    @property
-    def category(self) -> str:
-        return "SESSION_SCRATCHPAD"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "key": {"type": "string", "description": "The scratchpad key (with or without 'ref:' prefix)"},
-                "chunk_index": {"type": "integer", "description": "Zero-based chunk index (default: 0)"},
-            },
-            "required": ["key"],
-        }
+    name = "scratchpad_read_chunk"
+    description = "Read a specific chunk of scratchpad content by key."
+    category = "SESSION_SCRATCHPAD"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "key": {"type": "string", "description": "The scratchpad key (with or without 'ref:' prefix)"},
+            "chunk_index": {"type": "integer", "description": "Zero-based chunk index (default: 0)"},
+        },
+        "required": ["key"],
+    }
 
     def execute(self, key: str, chunk_index: int = 0) -> str:
-        self._emit(f"📖 Reading scratchpad chunk: '{key}' [{chunk_index}]...")
+        self._emit_lazy(lambda: f"📖 Reading scratchpad chunk: '{key}' [{chunk_index}]...")
         if not self.scratchpad:
             return "❌ Error: Scratchpad not initialized."
+        # Normalize once here; read_chunk works on bare keys only
+        if key.startswith("ref:"):
+            key = key[4:]
         result = self.scratchpad.read_chunk(key, chunk_index)
         if result is None:
             return f"⚠️ Key '{key}' not found in scratchpad. [HINT]: Use scratchpad_list to see available keys."
         return result
 
 class ScratchpadSearchTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "scratchpad_search"
-
-    @property
-    def description(self) -> str:
-        return "Search scratchpad content by keyword."
-
-    @property
-    def category(self) -> str:
-        return "SESSION_SCRATCHPAD"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {"type": "string", "description": "Search term"},
-            },
-            "required": ["query"],
-        }
+    name = "scratchpad_search"
+    description = "Search scratchpad content by keyword."
+    category = "SESSION_SCRATCHPAD"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "Search term"},
+        },
+        "required": ["query"],
+    }
 
     def execute(self, query: str) -> str:
-        self._emit(f"🔍 Searching scratchpad for: '{query}'...")
+        self._emit_lazy(lambda: f"🔍 Searching scratchpad for: '{query}'...")
         if not self.scratchpad:
             return "❌ Error: Scratchpad not initialized."
-        results = self.scratchpad.search(query)
+        if not self.scratchpad.count:
+            return _EMPTY_MSG
+        results = self.scratchpad.search(query, preview_chars=100)
         if not results:
             return f"No scratchpad items matching '{query}'."
-        lines = [f"Found {len(results)} match(es):\n"]
-        for r in results:
-            lines.append(f"• ref:{r['key']} — {r['description']}\n  Preview: {r['preview'][:100]}...")
-        return "\n".join(lines)
+        return f"Found {len(results)} match(es):\n\n" + "\n".join(
+            f"• ref:{r['key']} — {r['description']}\n  Preview: {r['preview']}..."
+            for r in results
+        )
 
 
 class ScratchpadUpdateGoalTool(BaseTool):
@@ -143,51 +112,44 @@ class ScratchpadUpdateGoalTool(BaseTool):
     reads at the start of every follow-up turn to avoid losing context.
     """
 
-    @property
-    def name(self) -> str:
-        return "scratchpad_update_goal"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Save or update the structured task goal anchor (key=task_goal). "
-            "Use this at the START of any multi-step task and AFTER each refinement turn "
-            "to track the current state, remaining steps, and user preferences. "
-            "The AI reads this at the beginning of every follow-up to stay oriented."
-        )
-
-    @property
-    def category(self) -> str:
-        return "SESSION_SCRATCHPAD"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "goal": {
-                    "type": "string",
-                    "description": "One-line description of the user's final objective",
-                },
-                "scope": {
-                    "type": "string",
-                    "description": "Key constraints — e.g. '10 slides, business audience, dark theme'",
-                },
-                "current_state": {
-                    "type": "string",
-                    "description": "What has been produced so far — e.g. 'slides 1-10 created, slide 3 needs more detail'",
-                },
-                "next_steps": {
-                    "type": "string",
-                    "description": "What still needs to be done to fulfil the goal",
-                },
-                "user_preferences": {
-                    "type": "string",
-                    "description": "Style, tone, format, or other preferences stated by the user",
-                },
+    name = "scratchpad_update_goal"
+    description = (
+        "Save or update the structured task goal anchor (key=task_goal). "
+        "Use this at the START of any multi-step task and AFTER each refinement turn "
+        "to track the current state, remaining steps, and user preferences. "
+        "The AI reads this at the beginning of every follow-up to stay oriented."
+    )
+    category = "SESSION_SCRATCHPAD"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "goal": {
+                "type": "string",
+                "description": "One-line description of the user's final objective",
+            },
+            "scope": {
+                "type": "string",
+                "description": "Key constraints — e.g. '10 slides, business audience, dark theme'",
             },
-            "required": ["goal", "current_state", "next_steps"],
-        }
+            "current_state": {
+                "type": "string",
+                "description": "What has been produced so far — e.g. 'slides 1-10 created, slide 3 needs more detail'",
+            },
+            "next_steps": {
+                "type": "string",
+                "description": "What still needs to be done to fulfil the goal",
+            },
+            "user_preferences": {
+                "type": "string",
+                "description": "Style, tone, format, or other preferences stated by the user",
+            },
+        },
+        "required": ["goal", "current_state", "next_steps"],
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._last_goal: Optional[tuple] = None  # (parts, index entry) of the last save
 
     def execute(
         self,
@@ -201,18 +163,25 @@ class ScratchpadUpdateGoalTool(BaseTool):
         if not self.scratchpad:
             return "❌ Error: Scratchpad not initialized."
 
-        content = (
-            f"GOAL: {goal}\n"
-            f"SCOPE: {scope or 'not specified'}\n"
-            f"CURRENT_STATE: {current_state}\n"
-            f"NEXT_STEPS: {next_steps}\n"
-            f"USER_PREFERENCES: {user_preferences or 'none specified'}"
-        )
-        ref = self.scratchpad.save(
-            key="task_goal",
-            content=content,
-            description=f"Task goal: {goal[:60]}{'...' if len(goal) > 60 else ''}",
+        parts = (
+            "GOAL: " + goal,
+            "SCOPE: " + (scope or "not specified"),
+            "CURRENT_STATE: " + current_state,
+            "NEXT_STEPS: " + next_steps,
+            "USER_PREFERENCES: " + (user_preferences or "none specified"),
         )
+        # Re-sending an unchanged anchor is common; skip the disk write + reindex as
+        # long as the entry we wrote is still the live one (not purged/overwritten)
+        last = self._last_goal
+        if last and last[0] == parts and last[1] is self.scratchpad.meta("task_goal"):
+            ref = "ref:task_goal"
+        else:
+            ref = self.scratchpad.save(
+                key="task_goal",
+                content="\n".join(parts),
+                description=f"Task goal: {_trunc(goal)}",
+            )
+            self._last_goal = (parts, self.scratchpad.meta("task_goal"))
         return (
             f"✅ Task goal anchor saved as {ref}. "
             f"The AI will read this at the start of every follow-up turn to stay oriented."
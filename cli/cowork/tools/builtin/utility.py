@@ -3,12 +3,49 @@
 Basic mathematical and temporal functions.
 """
 
+import ast
 import math
+import operator
 import re
-import unicodedata
-from typing import Any, Dict, Optional
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from ..base import BaseTool
 
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+
+# Markdown constructs stripped for TTS, applied in order. Each pass sees the output
+# of the previous one, so nested markup (bold inside a link, a link inside a list
+# item) is unwrapped layer by layer. Images run before links so no '!alt' is left.
+_MD_PASSES = tuple((re.compile(pattern, flags), repl) for pattern, repl, flags in (
+    (r"(\*\*|__)(.*?)\1", r"\2", re.DOTALL),
+    (r"(\*|_)(.*?)\1", r"\2", re.DOTALL),
+    (r"`{1,3}(.*?)`{1,3}", r"\1", re.DOTALL),
+    (r"~~(.*?)~~", r"\1", re.DOTALL),
+    (r"^#{1,6}\s*(.*)$", r"\1", re.MULTILINE),
+    (r"!\[.*?\]\(.*?\)", "", re.DOTALL),
+    (r"\[(.*?)\]\(.*?\)", r"\1", re.DOTALL),
+    (r"^\s*>\s*(.*)$", r"\1", re.MULTILINE),
+    (r"^\s*[-*+]\s*(.*)$", r"\1", re.MULTILINE),
+))
+_PARA_RE = re.compile(r"\n{2,}")
+# Whole-input check: inline markers anywhere, block markers only at line starts.
+# Passes only ever delete characters, so input with none of these is left as is.
+_MD_SENTINEL_RE = re.compile(r"[*_`~\[]|^\s*[-+>]|^#", re.MULTILINE)
+
+# Characters TTS can't voice: anything but Unicode letters/digits (L*/N*), whitespace
+# and basic punctuation. \w would also keep "_", so it is listed explicitly.
+_FILTER_RE = re.compile(r"[^\w\s.,!?;:'\"(){}\[\]\-]|_")
+# ASCII code points to drop, as a bytes.translate delete set: pure-ASCII text
+# (the common case) is filtered as raw bytes, mapping "\n" to " " in the same pass.
+_ASCII_DROP = bytes(cp for cp in range(128) if _FILTER_RE.match(chr(cp)))
+_ASCII_MAP = bytes.maketrans(b"\n", b" ")
+
 
 def sanitize_for_audio(text: str) -> str:
     """
@@ -16,146 +53,191 @@ def sanitize_for_audio(text: str) -> str:
     Mirrors the sanitization pipeline requested by the user.
     """
     sanitized = text or ""
-    sanitized = re.sub(r"(\*\*|__)(.*?)\1", r"\2", sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r"(\*|_)(.*?)\1", r"\2", sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r"`{1,3}(.*?)`{1,3}", r"\1", sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r"~~(.*?)~~", r"\1", sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r"(?m)^#{1,6}\s*(.*)$", r"\1", sanitized)
-    sanitized = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r"!\[.*?\]\(.*?\)", "", sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r"(?m)^\s*>\s*(.*)$", r"\1", sanitized)
-    sanitized = re.sub(r"(?m)^\s*[-*+]\s*(.*)$", r"\1", sanitized)
-    sanitized = re.sub(r"\n{2,}", ". ", sanitized)
-    sanitized = sanitized.replace("\n", " ")
-
-    allowed_punct = set(".,!?;:'\"(){}[]-")
-    filtered_chars = []
-    for ch in sanitized:
-        cat = unicodedata.category(ch)
-        if ch.isspace() or ch in allowed_punct or cat.startswith("L") or cat.startswith("N"):
-            filtered_chars.append(ch)
-    return "".join(filtered_chars).strip()
+    if _MD_SENTINEL_RE.search(sanitized):
+        for pattern, repl in _MD_PASSES:
+            sanitized = pattern.sub(repl, sanitized)
+    if "\n\n" in sanitized:
+        sanitized = _PARA_RE.sub(". ", sanitized)
+    if sanitized.isascii():
+        return sanitized.encode("ascii").translate(_ASCII_MAP, _ASCII_DROP).decode("ascii").strip()
+    return _FILTER_RE.sub("", sanitized).replace("\n", " ").strip()
+
+
+_CALC_FUNCS = {
+    "sqrt": math.sqrt, "log": math.log, "log2": math.log2, "log10": math.log10,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "abs": abs, "round": round, "pow": pow, "min": min, "max": max,
+}
+_CALC_CONSTS = {"pi": math.pi, "e": math.e}
+_CALC_BINOPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow,
+}
+_CALC_UNARYOPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def _build_calc(node: ast.AST):
+    """
+    Turn a whitelisted AST node into a zero-arg closure. Validation happens
+    here, once; anything outside the whitelist raises before evaluation.
+    """
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float, complex)):
+            raise ValueError(f"unsupported constant {node.value!r}")
+        value = node.value
+        return lambda: value
+    if isinstance(node, ast.Name):
+        if node.id not in _CALC_CONSTS:
+            raise NameError(f"name '{node.id}' is not defined")
+        value = _CALC_CONSTS[node.id]
+        return lambda: value
+    if isinstance(node, ast.BinOp):
+        op = _CALC_BINOPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"unsupported operator {type(node.op).__name__}")
+        left, right = _build_calc(node.left), _build_calc(node.right)
+        return lambda: op(left(), right())
+    if isinstance(node, ast.UnaryOp):
+        op = _CALC_UNARYOPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"unsupported operator {type(node.op).__name__}")
+        operand = _build_calc(node.operand)
+        return lambda: op(operand())
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _CALC_FUNCS or node.keywords:
+            raise ValueError(f"unsupported call {ast.unparse(node.func)}()")
+        fn = _CALC_FUNCS[node.func.id]
+        args = tuple(_build_calc(a) for a in node.args)
+        return lambda: fn(*[a() for a in args])
+    if isinstance(node, (ast.List, ast.Tuple)):
+        # e.g. max([1, 2, 3])
+        items = tuple(_build_calc(el) for el in node.elts)
+        return lambda: [i() for i in items]
+    raise ValueError(f"unsupported expression {type(node).__name__}")
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(src: str):
+    """Parse + validate a calc expression once; retries reuse the closure."""
+    return _build_calc(ast.parse(src.strip(), filename="<calc>", mode="eval").body)
 
 
 class CalcTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "calc"
-
-    @property
-    def description(self) -> str:
-        return "Evaluate a mathematical expression. Supports +, -, *, /, **, sqrt, log, etc."
-
-    @property
-    def category(self) -> str:
-        return "DATA_AND_UTILITY"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "expression": {"type": "string", "description": "Math expression to evaluate, e.g. '2 ** 10 + sqrt(144)'"},
-            },
-            "required": ["expression"],
-        }
+    name = "calc"
+    description = "Evaluate a mathematical expression. Supports +, -, *, /, **, sqrt, log, etc."
+    category = "DATA_AND_UTILITY"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "expression": {"type": "string", "description": "Math expression to evaluate, e.g. '2 ** 10 + sqrt(144)'"},
+        },
+        "required": ["expression"],
+    }
 
     def execute(self, expression: str) -> str:
         self._emit("🔢 Evaluating mathematical expression...")
-        safe_globals = {
-            "__builtins__": {},
-            "sqrt": math.sqrt, "log": math.log, "log2": math.log2, "log10": math.log10,
-            "sin": math.sin, "cos": math.cos, "tan": math.tan,
-            "pi": math.pi, "e": math.e, "abs": abs, "round": round,
-            "pow": pow, "min": min, "max": max,
-        }
         try:
-            result = eval(expression, safe_globals)  # noqa: S307
+            result = _compile_expr(expression)()
             return f"Result: {result}"
         except Exception as ex:
             return f"Calculation error: {ex}"
 
+@lru_cache(maxsize=128)
+def _zi(name: str):
+    """
+    ZoneInfo per name, so the tzdata file is only read and parsed once.
+    Unknown names are cached as None so a bad zone isn't searched for again.
+    """
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
 class GetTimeTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "get_time"
-
-    @property
-    def description(self) -> str:
-        return "Get the current date and time, optionally for a specific timezone."
-
-    @property
-    def category(self) -> str:
-        return "DATA_AND_UTILITY"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "timezone": {"type": "string", "description": "Timezone name, e.g. 'UTC', 'US/Eastern'"},
-            },
-            "required": [],
-        }
+    name = "get_time"
+    description = "Get the current date and time, optionally for a specific timezone."
+    category = "DATA_AND_UTILITY"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "timezone": {"type": "string", "description": "Timezone name, e.g. 'UTC', 'US/Eastern'"},
+        },
+        "required": [],
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (timezone arg, unix second, output) of the last call: back-to-back calls
+        # within the same wall-clock second reuse the formatted result
+        self._last: Optional[Tuple[Optional[str], int, str]] = None
 
     def execute(self, timezone: Optional[str] = None) -> str:
         self._emit("⏰ Fetching current time...")
-        from datetime import datetime
-        try:
-            from zoneinfo import ZoneInfo
-        except ImportError:
-            ZoneInfo = None
+        t = time.time()
+        ts = int(t)
+        last = self._last
+        if last and last[0] == timezone and last[1] == ts:
+            return last[2]
 
-        now = datetime.now().astimezone()
-        
         if timezone and timezone.upper() != "LOCAL":
             if timezone.upper() == "UTC":
-                from datetime import timezone as dt_timezone
-                now = datetime.now(dt_timezone.utc)
+                now = datetime.fromtimestamp(t, dt_timezone.utc)
             elif ZoneInfo:
-                try:
-                    now = datetime.now(ZoneInfo(timezone))
-                except Exception:
+                tz = _zi(timezone)
+                if tz is None:
                     return f"❌ Error: Invalid or unknown timezone '{timezone}'."
+                now = datetime.fromtimestamp(t, tz)
             else:
                 return f"❌ Error: Timezone support requires Python 3.9+ or zoneinfo backport."
+        else:
+            now = datetime.fromtimestamp(t).astimezone()
 
-        return (
-            f"Current time ({timezone or 'Local'}): {now.strftime('%Y-%m-%d %H:%M:%S %z')}\n"
+        out = (
+            f"Current time ({timezone or 'Local'}): {now:%Y-%m-%d %H:%M:%S %z}\n"
             f"ISO 8601: {now.isoformat()}\n"
-            f"Unix timestamp: {int(now.timestamp())}"
+            f"Unix timestamp: {ts}"
         )
+        self._last = (timezone, ts, out)
+        return out
 
 class GenDiagramTool(BaseTool):
-    @property
-    def name(self) -> str:
-        return "gen_diagram"
-
-    @property
-    def description(self) -> str:
-        return "Generate a Mermaid.js diagram from a description."
-
-    @property
-    def category(self) -> str:
-        return "DATA_AND_UTILITY"
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "diagram_type": {"type": "string", "description": "Type: flowchart, sequenceDiagram, erDiagram, gantt, pie"},
-                "description": {"type": "string", "description": "Natural language description of the diagram"},
-            },
-            "required": ["diagram_type", "description"],
-        }
+    # diagram_type → (prefix, suffix) wrapped around the description
+    _TEMPLATES: Dict[str, Tuple[str, str]] = {
+        "flowchart": (
+            "```mermaid\nflowchart TD\n    A[Start] --> B{Decision}\n    B -- Yes --> C[Action]\n    B -- No --> D[End]\n    C --> D\n```\n\n*Diagram for: ",
+            "*",
+        ),
+        "sequenceDiagram": (
+            "```mermaid\nsequenceDiagram\n    participant A as Actor A\n    participant B as Actor B\n    A->>B: Request\n    B-->>A: Response\n```\n\n*Sequence for: ",
+            "*",
+        ),
+        "pie": (
+            "```mermaid\npie title Distribution\n    \"Category A\" : 40\n    \"Category B\" : 35\n    \"Category C\" : 25\n```\n\n*Pie chart for: ",
+            "*",
+        ),
+        "gantt": (
+            "```mermaid\ngantt\n    title Project Timeline\n    dateFormat YYYY-MM-DD\n    section Phase 1\n    Task A :a1, 2024-01-01, 7d\n    Task B :a2, after a1, 5d\n```\n\n*Gantt for: ",
+            "*",
+        ),
+    }
+
+    name = "gen_diagram"
+    description = "Generate a Mermaid.js diagram from a description."
+    category = "DATA_AND_UTILITY"
+    parameters: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "diagram_type": {"type": "string", "description": "Type: flowchart, sequenceDiagram, erDiagram, gantt, pie"},
+            "description": {"type": "string", "description": "Natural language description of the diagram"},
+        },
+        "required": ["diagram_type", "description"],
+    }
 
     def execute(self, diagram_type: str, description: str) -> str:
-        self._emit(f"📐 Generating {diagram_type} diagram...")
-        templates = {
-            "flowchart": f"```mermaid\nflowchart TD\n    A[Start] --> B{{Decision}}\n    B -- Yes --> C[Action]\n    B -- No --> D[End]\n    C --> D\n```\n\n*Diagram for: {description}*",
-            "sequenceDiagram": f"```mermaid\nsequenceDiagram\n    participant A as Actor A\n    participant B as Actor B\n    A->>B: Request\n    B-->>A: Response\n```\n\n*Sequence for: {description}*",
-            "pie": f"```mermaid\npie title Distribution\n    \"Category A\" : 40\n    \"Category B\" : 35\n    \"Category C\" : 25\n```\n\n*Pie chart for: {description}*",
-            "gantt": f"```mermaid\ngantt\n    title Project Timeline\n    dateFormat YYYY-MM-DD\n    section Phase 1\n    Task A :a1, 2024-01-01, 7d\n    Task B :a2, after a1, 5d\n```\n\n*Gantt for: {description}*",
-        }
-        return templates.get(diagram_type, f"```mermaid\n{diagram_type}\n    %% {description}\n```")
+        self._emit_lazy(lambda: f"📐 Generating {diagram_type} diagram...")
+        template = self._TEMPLATES.get(diagram_type)
+        if template is None:
+            return f"```mermaid\n{diagram_type}\n    %% {description}\n```"
+        return template[0] + description + template[1]
@@ -3,13 +3,67 @@
 Tools for interacting with the workspace filesystem and session artifacts.
 """
 
+import io
+import os
 import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 from ..base import BaseTool
-from ...workspace import WorkspaceSession, workspace_manager, WORKSPACE_ROOT
+from ...workspace import WorkspaceSession, workspace_manager, WORKSPACE_ROOT, _SESSION_CACHE
+
+
+def _fast_read_text(path: Path) -> str:
+    """
+    Whole-file read as one unbuffered bytes read + a single decode, skipping the
+    BufferedReader/TextIOWrapper layers. Newlines are normalized the way
+    read_text() does.
+    """
+    with open(path, "rb", buffering=0) as f:
+        text = f.readall().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _fast_write_text(path: Path, content: str) -> int:
+    """
+    Whole-file write as one encode + raw os.write loop, skipping the
+    TextIOWrapper/BufferedWriter layers. Returns the number of bytes written.
+    """
+    data = content.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return len(data)
+
+
+def _resolve_session(scratchpad: Any) -> Optional[WorkspaceSession]:
+    """The workspace session backing `scratchpad`, cached by session_id."""
+    if not scratchpad:
+        return None
+    session_id = scratchpad.session_id
+    ws = _SESSION_CACHE.get(session_id)
+    if ws is not None and ws.path.is_dir():
+        return ws
+    slug = workspace_manager.get_slug_by_session_id(session_id)
+    ws = WorkspaceSession.load(slug) if slug else None
+    if ws:
+        _SESSION_CACHE[session_id] = ws
+    return ws
+
+
+class _WorkspaceSessionMixin:
+    """Shared session lookup for tools that operate on the active workspace."""
+
+    def _get_workspace_session(self) -> Optional[WorkspaceSession]:
+        return _resolve_session(self.scratchpad)
+
 
-class WorkspaceWriteTool(BaseTool):
+class WorkspaceWriteTool(_WorkspaceSessionMixin, BaseTool):
     @property
     def name(self) -> str:
         return "workspace_write"
@@ -37,21 +91,12 @@ class WorkspaceWriteTool(BaseTool):
             "required": ["filename", "content"],
         }
 
-    def _get_workspace_session(self) -> Optional[WorkspaceSession]:
-        if not self.scratchpad:
-            return None
-        session_id = self.scratchpad.session_id
-        for info in workspace_manager.list_all():
-            if info["session_id"] == session_id:
-                return WorkspaceSession.load(info["slug"])
-        return None
-
     def execute(self, filename: str, content: str) -> str:
         self._emit(f"📁 Writing workspace artifact: '{filename}'...")
         ws = self._get_workspace_session()
         if not ws:
             path = WORKSPACE_ROOT / filename
-            path.write_text(content, encoding="utf-8")
+            _fast_write_text(path, content)
             return f"✅ Written to workspace: {path}\n• Size: {len(content)} chars"
         path = ws.write_artifact(filename, content)
         return (
@@ -61,7 +106,7 @@ class WorkspaceWriteTool(BaseTool):
             f"• Size: {len(content):,} chars"
         )
 
-class WorkspaceReadTool(BaseTool):
+class WorkspaceReadTool(_WorkspaceSessionMixin, BaseTool):
     @property
     def name(self) -> str:
         return "workspace_read"
@@ -87,15 +132,6 @@ class WorkspaceReadTool(BaseTool):
             "required": ["filename"],
         }
 
-    def _get_workspace_session(self) -> Optional[WorkspaceSession]:
-        if not self.scratchpad:
-            return None
-        session_id = self.scratchpad.session_id
-        for info in workspace_manager.list_all():
-            if info["session_id"] == session_id:
-                return WorkspaceSession.load(info["slug"])
-        return None
-
     def execute(self, filename: str) -> str:
         self._emit(f"📖 Reading workspace file: '{filename}'...")
         ws = self._get_workspace_session()
@@ -106,13 +142,14 @@ class WorkspaceReadTool(BaseTool):
             content = ws.read_context()
             return content if content else "(context.md is empty)"
 
-        artifact_path = ws.artifacts_path / Path(filename).name
-        if artifact_path.exists():
-            return artifact_path.read_text(encoding="utf-8")
-
-        note_path = ws.notes_path / Path(filename).name
-        if note_path.exists():
-            return note_path.read_text(encoding="utf-8")
+        name = Path(filename).name
+        for subdir in (ws.ARTIFACTS_DIR, ws.NOTES_DIR):
+            path = ws.find_file(subdir, name)
+            if path is not None:
+                try:
+                    return _fast_read_text(path)
+                except FileNotFoundError:
+                    ws.forget_file(subdir, name)
 
         content = ws.scratchpad_get(filename)
         if content:
@@ -120,7 +157,7 @@ class WorkspaceReadTool(BaseTool):
 
         return f"❌ Error: File '{filename}' not found in workspace session '{ws.slug}'."
 
-class WorkspaceListTool(BaseTool):
+class WorkspaceListTool(_WorkspaceSessionMixin, BaseTool):
     @property
     def name(self) -> str:
         return "workspace_list"
@@ -137,53 +174,48 @@ class WorkspaceListTool(BaseTool):
     def parameters(self) -> Dict[str, Any]:
         return {"type": "object", "properties": {}, "required": []}
 
-    def _get_workspace_session(self) -> Optional[WorkspaceSession]:
-        if not self.scratchpad:
-            return None
-        session_id = self.scratchpad.session_id
-        for info in workspace_manager.list_all():
-            if info["session_id"] == session_id:
-                return WorkspaceSession.load(info["slug"])
-        return None
-
     def execute(self) -> str:
         self._emit("📋 Listing workspace session files...")
+        buf = io.StringIO()
+        write = buf.write
         ws = self._get_workspace_session()
         if not ws:
-            sessions = workspace_manager.list_all()
+            sessions = workspace_manager.list_all(limit=20)
             if not sessions:
                 return "No workspace sessions found."
-            lines = [f"📂 Workspace root: {WORKSPACE_ROOT}\n", "Sessions:"]
-            for s in sessions[:20]:
-                lines.append(f"  • {s['slug']}/ — {s['title']} ({s['message_count']} msgs)")
-            return "\n".join(lines)
-
-        lines = [f"📂 Session workspace: `{ws.slug}/`\n"]
-        if ws.context_path.exists():
-            size = ws.context_path.stat().st_size
-            lines.append(f"  📄 context.md ({size:,} bytes)")
+            write(f"📂 Workspace root: {WORKSPACE_ROOT}\n\nSessions:")
+            write("".join(
+                f"\n  • {s['slug']}/ — {s['title']} ({s['message_count']} msgs)" for s in sessions
+            ))
+            return buf.getvalue()
+
+        write(f"📂 Session workspace: `{ws.slug}/`\n")
+        try:
+            write(f"\n  📄 context.md ({ws.context_path.stat().st_size:,} bytes)")
+        except OSError:
+            pass
 
         artifacts = ws.list_artifacts()
         if artifacts:
-            lines.append(f"\n  📦 artifacts/ ({len(artifacts)} files):")
-            for a in artifacts:
-                lines.append(f"    • {a['filename']} ({a['size_bytes']:,} bytes)")
+            write(f"\n\n  📦 artifacts/ ({len(artifacts)} files):")
+            write("".join(f"\n    • {a['filename']} ({a['size_bytes']:,} bytes)" for a in artifacts))
 
-        notes = list(ws.notes_path.glob("*.md"))
+        with os.scandir(ws.notes_path) as it:
+            notes = sorted(e.name for e in it if e.name.endswith(".md") and e.is_file(follow_symlinks=False))
         if notes:
-            lines.append(f"\n  📝 notes/ ({len(notes)} files):")
-            for n in sorted(notes):
-                lines.append(f"    • {n.name}")
+            write(f"\n\n  📝 notes/ ({len(notes)} files):")
+            write("".join(f"\n    • {name}" for name in notes))
 
         blobs = ws.scratchpad_list()
         if blobs:
-            lines.append(f"\n  💾 scratchpad/ ({len(blobs)} blobs):")
-            for b in blobs:
-                lines.append(f"    • ref:{b['key']} — {b.get('description', '')} ({b['size_chars']:,} chars)")
+            write(f"\n\n  💾 scratchpad/ ({len(blobs)} blobs):")
+            write("".join(
+                f"\n    • ref:{b['key']} — {b.get('description', '')} ({b['size_chars']:,} chars)" for b in blobs
+            ))
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-class WorkspaceNoteTool(BaseTool):
+class WorkspaceNoteTool(_WorkspaceSessionMixin, BaseTool):
     @property
     def name(self) -> str:
         return "workspace_note"
@@ -212,15 +244,6 @@ class WorkspaceNoteTool(BaseTool):
             "required": ["title", "content"],
         }
 
-    def _get_workspace_session(self) -> Optional[WorkspaceSession]:
-        if not self.scratchpad:
-            return None
-        session_id = self.scratchpad.session_id
-        for info in workspace_manager.list_all():
-            if info["session_id"] == session_id:
-                return WorkspaceSession.load(info["slug"])
-        return None
-
     def execute(self, title: str, content: str, category: str = "General") -> str:
         self._emit(f"📝 Saving workspace note: '{title}'...")
         ws = self._get_workspace_session()
@@ -234,7 +257,7 @@ class WorkspaceNoteTool(BaseTool):
             f"• Path: `{path}`"
         )
 
-class WorkspaceContextUpdateTool(BaseTool):
+class WorkspaceContextUpdateTool(_WorkspaceSessionMixin, BaseTool):
     @property
     def name(self) -> str:
         return "workspace_context_update"
@@ -262,15 +285,6 @@ class WorkspaceContextUpdateTool(BaseTool):
             "required": ["content"],
         }
 
-    def _get_workspace_session(self) -> Optional[WorkspaceSession]:
-        if not self.scratchpad:
-            return None
-        session_id = self.scratchpad.session_id
-        for info in workspace_manager.list_all():
-            if info["session_id"] == session_id:
-                return WorkspaceSession.load(info["slug"])
-        return None
-
     def execute(self, content: str, replace: bool = False) -> str:
         self._emit("✏️  Updating session context.md...")
         ws = self._get_workspace_session()
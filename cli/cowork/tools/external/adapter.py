@@ -11,6 +11,13 @@ class ExternalToolAdapter(BaseTool):
     Wraps existing external tool functions into the new modular interface.
     """
 
+    # Plain attributes filled from the schema in __init__, so each lookup is a
+    # single instance-dict hit instead of a property call + nested dict walk.
+    name: str = ""
+    description: str = ""
+    category: str = ""
+    parameters: Dict[str, Any] = {}
+
     def __init__(
         self, 
         schema: Dict[str, Any], 
@@ -20,22 +27,11 @@ class ExternalToolAdapter(BaseTool):
         super().__init__(**kwargs)
         self._schema = schema
         self._handler = handler
-
-    @property
-    def name(self) -> str:
-        return self._schema["function"]["name"]
-
-    @property
-    def description(self) -> str:
-        return self._schema["function"]["description"]
-
-    @property
-    def category(self) -> str:
-        return self._schema["category"]
-
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return self._schema["function"]["parameters"]
+        fn = schema["function"]
+        self.name = fn["name"]
+        self.description = fn["description"]
+        self.category = schema["category"]
+        self.parameters = fn["parameters"]
 
     def execute(self, **kwargs) -> str:
         # Note: We don't call self._emit here because the handlers 
@@ -4,7 +4,22 @@ Implementations for GitHub search.
 """
 
 import urllib.parse
-from .utils import _env, _http_get, _TTL_GITHUB
+from functools import lru_cache
+from typing import Optional
+from .utils import _env, _freeze, _http_get, _TTL_GITHUB
+
+# search_type → endpoint prefix, ready for the query string
+_GH_BASE = {
+    "repositories": "https://api.github.com/search/repositories?",
+    "code":         "https://api.github.com/search/code?",
+    "issues":       "https://api.github.com/search/issues?",
+}
+
+@lru_cache(maxsize=4)
+def _gh_headers(token: Optional[str]) -> dict:
+    headers = {"Accept": "application/vnd.github+json"}
+    if token: headers["Authorization"] = f"Bearer {token}"
+    return headers
 
 def github_search(
     query: str,
@@ -12,11 +27,12 @@ def github_search(
     max_results: int = 5,
 ) -> str:
     """Search GitHub repositories, code, or issues."""
-    token = _env("GITHUB_TOKEN")
-    params = {"q": query, "per_page": min(max_results, 10)}
-    url = f"https://api.github.com/search/{search_type}?{urllib.parse.urlencode(params)}"
-    headers = {"Accept": "application/vnd.github+json"}
-    if token: headers["Authorization"] = f"Bearer {token}"
+    base = _GH_BASE.get(search_type)
+    if base is None:
+        return f"GitHub search failed: invalid search_type '{search_type}' (use repositories, code or issues)."
+    # Params in sorted key order → one canonical URL (and cache key) per logical query
+    url = base + urllib.parse.urlencode((("per_page", min(max_results, 10)), ("q", query)))
+    headers = _gh_headers(_env("GITHUB_TOKEN"))
 
     try:
         data = _http_get(url, headers=headers, ttl=_TTL_GITHUB)
@@ -31,7 +47,7 @@ def github_search(
     except Exception as e:
         return f"GitHub search failed: {e}"
 
-TOOLS = [
+TOOLS = _freeze([
     {
         "category": "CODING_TOOLS",
         "type": "function",
@@ -48,4 +64,4 @@ TOOLS = [
             },
         },
     },
-]
+])
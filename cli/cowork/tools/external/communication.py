@@ -3,16 +3,19 @@
 Implementations for SMTP, Telegram, Slack, and X (Twitter).
 """
 
-import mimetypes
-import os
-import smtplib
-from email.mime.base import MIMEBase
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email import encoders
-from pathlib import Path
-from typing import Optional
-from .utils import _env, _missing_key, _http_post
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import TYPE_CHECKING, Optional
+from .utils import _env_cached, _freeze, _load_attachments, _missing_key, _http_post
+
+# smtplib / email.* are imported where used: most sessions never
+# send an email, so startup shouldn't pay for loading them.
+if TYPE_CHECKING:
+    import smtplib
+    from email.message import Message
+    from email.mime.multipart import MIMEMultipart
 
 
 # ── Attachment helper ─────────────────────────────────────────────────────────
@@ -22,39 +25,139 @@ def _attach_files(msg: MIMEMultipart, attachments: list[str]) -> list[str]:
     Attach a list of file paths to a MIMEMultipart message.
     Returns a list of any errors encountered (missing/unreadable files).
     """
+    from email.mime.base import MIMEBase
+
     errors = []
-    for path_str in attachments:
-        path = Path(path_str.strip()).expanduser()
-        if not path.exists():
-            errors.append(f"File not found: {path}")
-            continue
-        if not path.is_file():
-            errors.append(f"Not a file: {path}")
+    for item, error in _load_attachments(attachments):
+        if error is not None:
+            errors.append(error)
             continue
+        path, main_type, sub_type, payload = item
+        part = MIMEBase(main_type, sub_type)
+        part.set_payload(payload)
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header(
+            "Content-Disposition",
+            "attachment",
+            filename=path.name,
+        )
+        msg.attach(part)
+
+    return errors
 
-        mime_type, _ = mimetypes.guess_type(str(path))
-        if mime_type:
-            main_type, sub_type = mime_type.split("/", 1)
-        else:
-            main_type, sub_type = "application", "octet-stream"
 
+# ── SMTP connection pool ──────────────────────────────────────────────────────
+
+# One authenticated connection per (host, port, user), reused across sends so
+# only the first email of a session pays the TCP + STARTTLS + AUTH handshake.
+_SMTP_POOL: dict[tuple, smtplib.SMTP] = {}
+_smtp_lock = threading.Lock()
+
+
+def _smtp_close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
         try:
-            with open(path, "rb") as f:
-                data = f.read()
-
-            part = MIMEBase(main_type, sub_type)
-            part.set_payload(data)
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                "attachment",
-                filename=path.name,
-            )
-            msg.attach(part)
-        except Exception as e:
-            errors.append(f"Could not attach {path.name}: {e}")
+            server.close()
+        except Exception:
+            pass
+
+
+# Permanent login rejection for the configured credentials. SMTP settings are
+# fixed for the process, so later sends fail fast instead of rebuilding MIME
+# trees and re-authenticating only to be rejected again. Only 535 (bad
+# credentials) and 534 (mechanism too weak) latch; smtplib raises the same
+# exception for transient replies such as 454, which must stay retryable.
+_SMTP_AUTH_ERROR: Optional[str] = None
+_SMTP_AUTH_PERMANENT = frozenset({534, 535})
+
+
+def _smtp_connect(host: str, port: int, user: str, password: str) -> smtplib.SMTP:
+    global _SMTP_AUTH_ERROR
+    import smtplib
+
+    server = smtplib.SMTP(host, port)
+    try:
+        server.starttls()
+        server.login(user, password)
+    except smtplib.SMTPAuthenticationError as e:
+        if e.smtp_code in _SMTP_AUTH_PERMANENT:
+            _SMTP_AUTH_ERROR = f"SMTP login rejected ({e.smtp_code}): {e.smtp_error.decode(errors='replace')}"
+        _smtp_close(server)
+        raise
+    except Exception:
+        _smtp_close(server)
+        raise
+    return server
+
+
+def _smtp_checkout(host: str, port: int, user: str, password: str) -> smtplib.SMTP:
+    """A live, authenticated connection: the pooled one if it still answers, else a new one."""
+    import smtplib
+
+    with _smtp_lock:
+        server = _SMTP_POOL.pop((host, port, user), None)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp_close(server)
+    return _smtp_connect(host, port, user, password)
 
-    return errors
+
+def _smtp_checkin(host: str, port: int, user: str, server: smtplib.SMTP) -> None:
+    with _smtp_lock:
+        spare = _SMTP_POOL.get((host, port, user))
+        _SMTP_POOL[(host, port, user)] = server
+    if spare is not None:
+        # A concurrent send pooled its own connection meanwhile; keep one
+        _smtp_close(spare)
+
+
+def _smtp_send(
+    server: smtplib.SMTP, host: str, port: int, user: str, password: str, msg: Message
+) -> None:
+    """Send `msg` over a checked-out connection, reconnecting once if the server dropped it."""
+    import smtplib
+
+    try:
+        server.send_message(msg)
+    except (smtplib.SMTPServerDisconnected, ConnectionError):
+        _smtp_close(server)
+        server = _smtp_connect(host, port, user, password)
+        try:
+            server.send_message(msg)
+        except Exception:
+            _smtp_close(server)
+            raise
+    _smtp_checkin(host, port, user, server)
+
+
+@atexit.register
+def _smtp_close_all() -> None:
+    with _smtp_lock:
+        for server in _SMTP_POOL.values():
+            _smtp_close(server)
+        _SMTP_POOL.clear()
+
+
+# (host, user, password, port) from the environment, resolved on first send
+_SMTP_CFG: Optional[tuple[Optional[str], Optional[str], Optional[str], int]] = None
+
+
+def _smtp_config() -> tuple[Optional[str], Optional[str], Optional[str], int]:
+    global _SMTP_CFG
+    if _SMTP_CFG is None:
+        _SMTP_CFG = (
+            _env_cached("SMTP_HOST"),
+            _env_cached("SMTP_USER"),
+            _env_cached("SMTP_PASS"),
+            int(_env_cached("SMTP_PORT") or 587),
+        )
+    return _SMTP_CFG
 
 
 # ── Tool implementations ──────────────────────────────────────────────────────
@@ -67,15 +170,35 @@ def smtp_send_email(
     html: bool = False,
 ) -> str:
     """Send an email via SMTP, with optional file attachments."""
-    host = _env("SMTP_HOST")
-    user = _env("SMTP_USER")
-    password = _env("SMTP_PASS")
-    port = int(_env("SMTP_PORT") or 587)
+    host, user, password, port = _smtp_config()
 
     if not all([host, user, password]):
         return "❌ SMTP configuration missing (SMTP_HOST, SMTP_USER, SMTP_PASS required)."
+    if _SMTP_AUTH_ERROR is not None:
+        return f"❌ Email failed: {_SMTP_AUTH_ERROR}"
+
+    # Connect (or revalidate the pooled connection) before any MIME is built
+    try:
+        server = _smtp_checkout(host, port, user, password)
+    except Exception as e:
+        return f"❌ Email failed: {e}"
 
     try:
+        if not attachments and not html:
+            from email.message import EmailMessage
+
+            # Most common shape: a single text/plain part, no multipart nesting
+            plain = EmailMessage()
+            plain["From"] = user
+            plain["To"] = recipient
+            plain["Subject"] = subject
+            plain.set_content(body)
+            _smtp_send(server, host, port, user, password, plain)
+            return f"✅ Email sent to {recipient}."
+
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         msg = MIMEMultipart("mixed")
         msg["From"] = user
         msg["To"] = recipient
@@ -91,10 +214,7 @@ def smtp_send_email(
         if attachments:
             attach_errors = _attach_files(msg, attachments)
 
-        with smtplib.SMTP(host, port) as server:
-            server.starttls()
-            server.login(user, password)
-            server.send_message(msg)
+        _smtp_send(server, host, port, user, password, msg)
 
         result = f"✅ Email sent to {recipient}."
         if attachments:
@@ -105,12 +225,13 @@ def smtp_send_email(
         return result
 
     except Exception as e:
+        _smtp_close(server)
         return f"❌ Email failed: {e}"
 
 
 def telegram_send_message(chat_id: str, text: str) -> str:
     """Send a message via Telegram Bot API."""
-    token = _env("TELEGRAM_BOT_TOKEN")
+    token = _env_cached("TELEGRAM_BOT_TOKEN")
     if not token: return _missing_key("telegram_send_message", "TELEGRAM_BOT_TOKEN")
 
     url = f"https://api.telegram.org/bot{token}/sendMessage"
@@ -124,7 +245,7 @@ def telegram_send_message(chat_id: str, text: str) -> str:
 
 def slack_send_message(channel: str, text: str) -> str:
     """Send a message to a Slack channel."""
-    token = _env("SLACK_BOT_TOKEN")
+    token = _env_cached("SLACK_BOT_TOKEN")
     if not token: return _missing_key("slack_send_message", "SLACK_BOT_TOKEN")
 
     url = "https://slack.com/api/chat.postMessage"
@@ -139,7 +260,7 @@ def slack_send_message(channel: str, text: str) -> str:
 
 def twitter_post_tweet(text: str) -> str:
     """Post a tweet to X (Twitter)."""
-    token = _env("TWITTER_BEARER_TOKEN")
+    token = _env_cached("TWITTER_BEARER_TOKEN")
     if not token: return _missing_key("twitter_post_tweet", "TWITTER_BEARER_TOKEN")
 
     url = "https://api.twitter.com/2/tweets"
@@ -154,7 +275,7 @@ def twitter_post_tweet(text: str) -> str:
 
 # ── Tool schemas ──────────────────────────────────────────────────────────────
 
-TOOLS = [
+TOOLS = _freeze([
     {
         "category": "COMMUNICATION_TOOLS",
         "type": "function",
@@ -243,4 +364,4 @@ TOOLS = [
             },
         },
     },
-]
+])
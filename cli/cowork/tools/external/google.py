@@ -4,10 +4,14 @@ Implementations for Google Calendar, Drive, and Gmail.
 """
 
 import base64
+import io
+import secrets
+import threading
 import time
+import urllib.parse
 from pathlib import Path
-from typing import Optional
-from .utils import _env
+from typing import Any, Optional
+from .utils import _env, _http_client, _load_attachments
 
 try:
     from google.auth.transport.requests import Request
@@ -18,30 +22,138 @@ try:
 except ImportError:
     GOOGLE_LIBS_AVAILABLE = False
 
+# scope tuple → Credentials. Loaded once per process; expired access tokens are
+# refreshed in place (_refresh_creds), and the token file is only rewritten then.
+# Creds whose refresh fails are evicted so the next call reloads or re-consents.
+_CREDS_CACHE: dict[tuple, Any] = {}
+# Per-thread (api, version, creds) → Resource. A Resource wraps an httplib2.Http,
+# which is not thread-safe, so each tool thread keeps its own (and its own
+# keep-alive connection) instead of rebuilding one per call.
+_services = threading.local()
+
+_refresh_lock = threading.Lock()
+_TOKEN_PATH = Path.home() / ".cowork" / "google_token.json"
+
+_CALENDAR_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+_DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+# Media upload: the RFC 5322 bytes go up as-is instead of as {"raw": base64url(...)}
+_GMAIL_SEND_URL = "https://gmail.googleapis.com/upload/gmail/v1/users/me/messages/send?uploadType=media"
+
 def _get_google_creds(scopes: list[str]):
     if not GOOGLE_LIBS_AVAILABLE: return None, "❌ Google libs missing."
-    token_path = Path.home() / ".cowork" / "google_token.json"
+    key = tuple(scopes)
+    creds = _CREDS_CACHE.get(key)
+    if creds is not None:
+        if creds.valid:
+            return creds, None
+        if creds.refresh_token:
+            try:
+                with _refresh_lock:
+                    if not creds.valid:
+                        _refresh_creds(creds)
+                return creds, None
+            except Exception:
+                # Revoked or expired refresh token: reload the token file / re-consent
+                _CREDS_CACHE.pop(key, None)
     creds_path = Path.home() / ".cowork" / "google_credentials.json"
     creds = None
-    if token_path.exists(): creds = Credentials.from_authorized_user_file(str(token_path), scopes)
+    if _TOKEN_PATH.exists(): creds = Credentials.from_authorized_user_file(str(_TOKEN_PATH), scopes)
+    if creds and creds.expired and creds.refresh_token:
+        # Silent refresh instead of sending the user through the browser flow again
+        try:
+            _refresh_creds(creds)
+        except Exception:
+            creds = None
     if not creds or not creds.valid:
         if not creds_path.exists(): return None, "❌ Google credentials missing."
         flow = InstalledAppFlow.from_client_secrets_file(str(creds_path), scopes)
         creds = flow.run_local_server(port=0)
-        with open(token_path, "w") as f: f.write(creds.to_json())
+        _save_creds(creds)
+    _CREDS_CACHE[key] = creds
     return creds, None
 
+def _evict_creds(creds) -> None:
+    """Drop `creds` from _CREDS_CACHE so the next _get_google_creds reloads them."""
+    for key, cached in list(_CREDS_CACHE.items()):
+        if cached is creds:
+            _CREDS_CACHE.pop(key, None)
+
+def _save_creds(creds) -> None:
+    with open(_TOKEN_PATH, "w") as f: f.write(creds.to_json())
+
+def _refresh_creds(creds) -> None:
+    """Refresh the access token in place; the token file is only rewritten here."""
+    creds.refresh(Request())
+    try:
+        _save_creds(creds)
+    except OSError:
+        pass
+
+def _google_request(
+    method: str,
+    url: str,
+    creds,
+    params: Optional[dict] = None,
+    json: Optional[dict] = None,
+    content: Optional[bytes] = None,
+    content_type: Optional[str] = None,
+) -> dict:
+    """
+    Authorized JSON call on the shared pooled HTTP client. Used for the plain REST
+    endpoints so they skip discovery/Resource objects and reuse the same keep-alive
+    connections (thread-safely) as the other external tools.
+    """
+    if not creds.valid:
+        # Calls from one agent step run concurrently; only the first refreshes
+        with _refresh_lock:
+            if not creds.valid:
+                try:
+                    _refresh_creds(creds)
+                except Exception:
+                    # Dead refresh token: don't keep handing these creds out
+                    _evict_creds(creds)
+                    raise
+    headers = {"Authorization": f"Bearer {creds.token}"}
+    if content_type:
+        headers["Content-Type"] = content_type
+    resp = _http_client().request(
+        method, url, params=params, json=json, content=content, headers=headers, timeout=20,
+    )
+    resp.raise_for_status()
+    return resp.json() if resp.content else {}
+
+def _service(api: str, version: str, creds) -> Any:
+    """Cached discovery-built client; static discovery docs, no on-disk discovery cache."""
+    cache = getattr(_services, "cache", None)
+    if cache is None:
+        cache = _services.cache = {}
+    # creds come from _CREDS_CACHE (one object per scope set), and the cached
+    # Resource keeps them alive, so id() is a stable key
+    key = (api, version, id(creds))
+    service = cache.get(key)
+    if service is None:
+        service = cache[key] = build(api, version, credentials=creds, cache_discovery=False, static_discovery=True)
+    return service
+
 def google_calendar_events(max_results: int = 10) -> str:
     """List upcoming Google Calendar events."""
     creds, err = _get_google_creds(["https://www.googleapis.com/auth/calendar.readonly"])
     if err: return err
     try:
-        service = build("calendar", "v3", credentials=creds)
-        res = service.events().list(calendarId="primary", timeMin=time.strftime("%Y-%m-%dT%H:%M:%SZ"), maxResults=max_results, singleEvents=True, orderBy="startTime").execute()
+        res = _google_request("GET", _CALENDAR_EVENTS_URL, creds, params={
+            "timeMin": time.strftime("%Y-%m-%dT%H:%M:%SZ"), "maxResults": max_results,
+            "singleEvents": "true", "orderBy": "startTime",
+            # Only the two fields rendered below; full event resources are ~20x larger
+            "fields": "items(summary,start(date,dateTime))",
+        })
         events = res.get("items", [])
-        lines = ["📅 **Google Calendar Events**\n"]
-        for e in events: lines.append(f"- **{e['summary']}** ({e['start'].get('dateTime', e['start'].get('date'))})")
-        return "\n".join(lines)
+        buf = io.StringIO()
+        w = buf.write
+        w("📅 **Google Calendar Events**\n")
+        for e in events:
+            start = e.get("start") or {}
+            w(f"\n- **{e.get('summary', '(no title)')}** ({start.get('dateTime') or start.get('date')})")
+        return buf.getvalue()
     except Exception as e: return f"❌ Calendar error: {e}"
 
 def google_drive_search(query: str) -> str:
@@ -49,12 +161,19 @@ def google_drive_search(query: str) -> str:
     creds, err = _get_google_creds(["https://www.googleapis.com/auth/drive.readonly"])
     if err: return err
     try:
-        service = build("drive", "v3", credentials=creds)
-        res = service.files().list(q=f"name contains '{query}'", pageSize=5).execute()
+        # Drive query strings are single-quoted; escape backslashes and quotes so
+        # a search like "Bob's notes" doesn't become a malformed (400) filter
+        safe = query.replace("\\", "\\\\").replace("'", "\\'")
+        res = _google_request("GET", _DRIVE_FILES_URL, creds, params={
+            "q": f"name contains '{safe}'", "pageSize": 5,
+            "fields": "files(id,name)", "spaces": "drive", "corpora": "user",
+        })
         files = res.get("files", [])
-        lines = ["📂 **Google Drive Results**\n"]
-        for f in files: lines.append(f"- {f['name']} (ID: {f['id']})")
-        return "\n".join(lines)
+        buf = io.StringIO()
+        w = buf.write
+        w("📂 **Google Drive Results**\n")
+        for f in files: w(f"\n- {f['name']} (ID: {f['id']})")
+        return buf.getvalue()
     except Exception as e: return f"❌ Drive error: {e}"
 
 def google_calendar_create_event(
@@ -67,13 +186,12 @@ def google_calendar_create_event(
     creds, err = _get_google_creds(["https://www.googleapis.com/auth/calendar"])
     if err: return err
     try:
-        service = build("calendar", "v3", credentials=creds)
         event = {
             "summary": summary, "location": location, "description": description,
             "start": {"dateTime": start_time, "timeZone": "UTC"},
             "end": {"dateTime": end_time, "timeZone": "UTC"},
         }
-        event = service.events().insert(calendarId="primary", body=event).execute()
+        event = _google_request("POST", _CALENDAR_EVENTS_URL, creds, json=event)
         return f"✅ Event created: {event.get('htmlLink')}"
     except Exception as e: return f"❌ Calendar error: {e}"
 
@@ -82,13 +200,74 @@ def google_drive_upload_text(filename: str, content: str, mime_type: str = "text
     if err: return err
     try:
         from googleapiclient.http import MediaInMemoryUpload
-        service = build("drive", "v3", credentials=creds)
+        service = _service("drive", "v3", creds)
         file_metadata = {"name": filename}
         media = MediaInMemoryUpload(content.encode("utf-8"), mimetype=mime_type)
         file = service.files().create(body=file_metadata, media_body=media, fields="id").execute()
         return f"✅ File uploaded to Drive. ID: {file.get('id')}"
     except Exception as e: return f"❌ Drive upload error: {e}"
 
+def _encode_header(value: str) -> str:
+    """Header value as ASCII: RFC 2047 base64 encoded-words when needed, folded."""
+    value = value.replace("\r", " ").replace("\n", " ")
+    if value.isascii():
+        return value
+    words, chunk, size = [], [], 0
+    for ch in value:
+        n = len(ch.encode("utf-8"))
+        if size + n > 45:  # 45 bytes → 60 base64 chars, inside the 75-char word limit
+            words.append("".join(chunk))
+            chunk, size = [], 0
+        chunk.append(ch)
+        size += n
+    words.append("".join(chunk))
+    return "\n ".join(
+        f"=?utf-8?b?{base64.b64encode(w.encode('utf-8')).decode('ascii')}?=" for w in words
+    )
+
+def _attachment_disposition(name: str) -> str:
+    if name.isascii() and '"' not in name and "\\" not in name:
+        return f'attachment; filename="{name}"'
+    return f"attachment; filename*=utf-8''{urllib.parse.quote(name)}"
+
+def _build_rfc5322(
+    recipient: str,
+    subject: str,
+    body: str,
+    html: bool,
+    attachments: list[tuple[Path, str, str, str]],
+) -> bytes:
+    """
+    Gmail `raw` message assembled directly as text: headers as strings, every
+    part base64 once. Attachments come pre-encoded from _load_attachment, so
+    there is no email.* object tree and no as_bytes() re-serialization.
+    """
+    boundary = f"===============cowork{secrets.token_hex(12)}=="
+    body_b64 = base64.encodebytes(body.encode("utf-8")).decode("ascii")
+    out = [
+        f"MIME-Version: 1.0\n"
+        f"To: {_encode_header(recipient)}\n"
+        f"Subject: {_encode_header(subject)}\n"
+        f'Content-Type: multipart/mixed; boundary="{boundary}"\n'
+        f"\n"
+        f"--{boundary}\n"
+        f'Content-Type: text/{"html" if html else "plain"}; charset="utf-8"\n'
+        f"Content-Transfer-Encoding: base64\n"
+        f"\n",
+        body_b64,
+    ]
+    for path, main_type, sub_type, payload in attachments:
+        out.append(
+            f"\n--{boundary}\n"
+            f"Content-Type: {main_type}/{sub_type}\n"
+            f"Content-Transfer-Encoding: base64\n"
+            f"Content-Disposition: {_attachment_disposition(path.name)}\n"
+            f"\n"
+        )
+        out.append(payload)
+    out.append(f"\n--{boundary}--\n")
+    return "".join(out).encode("ascii")
+
 def gmail_send_email(
     recipient: str,
     subject: str,
@@ -96,50 +275,24 @@ def gmail_send_email(
     attachments: Optional[list] = None,
     html: bool = False,
 ) -> str:
-    import base64 as _base64
-    import mimetypes
-    from email.mime.multipart import MIMEMultipart
-    from email.mime.text import MIMEText
-    from email.mime.base import MIMEBase
-    from email import encoders
-
     creds, err = _get_google_creds(["https://www.googleapis.com/auth/gmail.send"])
     if err: return err
     try:
-        service = build("gmail", "v1", credentials=creds)
-
-        message = MIMEMultipart("mixed")
-        message["to"] = recipient
-        message["subject"] = subject
-
-        # Body
-        body_part = MIMEMultipart("alternative")
-        body_part.attach(MIMEText(body, "html" if html else "plain", "utf-8"))
-        message.attach(body_part)
-
-        # Attachments
+        loaded = []
         attach_errors = []
-        if attachments:
-            for path_str in attachments:
-                path = Path(path_str.strip()).expanduser()
-                if not path.exists() or not path.is_file():
-                    attach_errors.append(f"File not found: {path}")
-                    continue
-                mime_type, _ = mimetypes.guess_type(str(path))
-                main_type, sub_type = (mime_type.split("/", 1) if mime_type else ("application", "octet-stream"))
-                try:
-                    with open(path, "rb") as f:
-                        data = f.read()
-                    part = MIMEBase(main_type, sub_type)
-                    part.set_payload(data)
-                    encoders.encode_base64(part)
-                    part.add_header("Content-Disposition", "attachment", filename=path.name)
-                    message.attach(part)
-                except Exception as e:
-                    attach_errors.append(f"Could not attach {path.name}: {e}")
-
-        raw = _base64.urlsafe_b64encode(message.as_bytes()).decode()
-        service.users().messages().send(userId="me", body={"raw": raw}).execute()
+        for item, error in _load_attachments(attachments or []):
+            if error is not None:
+                attach_errors.append(error)
+            else:
+                loaded.append(item)
+
+        # Attachments are base64-encoded exactly once (in _load_attachment); the
+        # assembled message is uploaded verbatim, with no base64url + JSON wrapping
+        _google_request(
+            "POST", _GMAIL_SEND_URL, creds,
+            content=_build_rfc5322(recipient, subject, body, html, loaded),
+            content_type="message/rfc822",
+        )
 
         result = f"✅ Email sent via Gmail to {recipient}."
         if attachments:
@@ -3,6 +3,7 @@
 Aggregates modular tool implementations from per-service files.
 """
 
+from functools import lru_cache
 from typing import Any, Optional
 from .utils import _env
 
@@ -23,7 +24,6 @@ from . import social
 # Re-export key functions for tools/__init__.py or manager.py if needed
 # But better to aggregate them here.
 
-EXTERNAL_TOOLS: list[dict] = []
 EXTERNAL_TOOL_HANDLERS: dict[str, Any] = {}
 
 # Aggregate from all modules
@@ -32,16 +32,26 @@ _modules = [
     media, knowledge, communication, google, social
 ]
 
+_registered: set[str] = set()
+_tools: list[dict] = []
 for mod in _modules:
-    # Add tools schemas
-    EXTERNAL_TOOLS.extend(mod.TOOLS)
-    # Add handlers
     for tool_schema in mod.TOOLS:
         name = tool_schema["function"]["name"]
+        # First definition wins: a later module can't shadow an earlier schema/handler
+        if name in _registered:
+            continue
+        _registered.add(name)
+        # Add tool schema
+        _tools.append(tool_schema)
+        # Add handler
         handler = getattr(mod, name, None)
         if handler:
             EXTERNAL_TOOL_HANDLERS[name] = handler
 
+# Built once at import; read-only afterwards
+EXTERNAL_TOOLS: tuple[dict, ...] = tuple(_tools)
+del _tools, _registered
+
 # Maintain KEY_REQUIREMENTS for get_available_external_tools
 KEY_REQUIREMENTS: dict[str, str | list[str] | None] = {
     "youtube_search":       "YOUTUBE_API_KEY",
@@ -73,24 +83,38 @@ KEY_REQUIREMENTS: dict[str, str | list[str] | None] = {
     "whatsapp_send_message":None,
 }
 
-def get_available_external_tools() -> list[dict]:
-    """Return only the external tools whose required API keys are configured."""
-    available = []
-    for tool in EXTERNAL_TOOLS:
-        name = tool["function"]["name"]
-        required = KEY_REQUIREMENTS.get(name)
-        
-        is_available = False
-        if required is None:
-            is_available = True
-        elif isinstance(required, list):
-            is_available = any(_env(k) for k in required)
-        else:
-            is_available = bool(_env(required))
+# Every env var any tool depends on: availability only changes when one of these does
+_REQUIRED_ENV_KEYS: tuple[str, ...] = tuple(sorted({
+    k for req in KEY_REQUIREMENTS.values() if req
+    for k in ([req] if isinstance(req, str) else req)
+}))
+
+def _gate(required: str | list[str] | None) -> tuple[int, ...] | None:
+    """Positions in _REQUIRED_ENV_KEYS of which any one unlocks a tool (None: always on)."""
+    if required is None:
+        return None
+    keys = [required] if isinstance(required, str) else required
+    return tuple(_REQUIRED_ENV_KEYS.index(k) for k in keys)
+
+# Precompiled per-tool gates, aligned with EXTERNAL_TOOLS
+_GATES: tuple[tuple[int, ...] | None, ...] = tuple(
+    _gate(KEY_REQUIREMENTS.get(t["function"]["name"])) for t in EXTERNAL_TOOLS
+)
+
+def get_available_external_tools() -> tuple[dict, ...]:
+    """
+    Return only the external tools whose required API keys are configured.
+    Memoized on which of the required keys are set, so repeated calls per turn
+    skip the rescan while still reacting to keys added at runtime.
+    """
+    return _available_for(tuple(bool(_env(k)) for k in _REQUIRED_ENV_KEYS))
 
-        if is_available:
-            available.append(tool)
-    return available
+@lru_cache(maxsize=8)
+def _available_for(key_state: tuple[bool, ...]) -> tuple[dict, ...]:
+    return tuple(
+        tool for tool, gate in zip(EXTERNAL_TOOLS, _GATES)
+        if gate is None or any(key_state[i] for i in gate)
+    )
 
 # Re-export specific implementations that might be used elsewhere (like openweather_current in connectors.py)
 openweather_current = weather.openweather_current
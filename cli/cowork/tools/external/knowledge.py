@@ -5,30 +5,46 @@ Implementations for Wikipedia.
 
 import re
 import urllib.parse
-from .utils import _http_get, _TTL_WIKI
+from .utils import _http_get, _http_get_many, _TTL_WIKI
 
-def wikipedia_search(query: str, max_results: int = 5) -> str:
-    """Search Wikipedia for matching article titles."""
-    params = urllib.parse.urlencode({"action": "opensearch", "search": query, "limit": max_results, "format": "json"})
-    url = f"https://en.wikipedia.org/w/api.php?{params}"
+_WIKI_API = "https://en.wikipedia.org/w/api.php?"
+_WIKI_SUMMARY = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+
+def _wiki_summary_url(title: str) -> str:
+    return _WIKI_SUMMARY + urllib.parse.quote(title.replace(" ", "_"))
+
+def wikipedia_search(query: str, max_results: int = 5, with_summaries: bool = False) -> str:
+    """
+    Search Wikipedia for matching article titles.
+    With with_summaries, each hit's summary is fetched too, as one parallel batch,
+    saving the usual follow-up wikipedia_article call per title.
+    """
+    url = _WIKI_API + urllib.parse.urlencode(
+        (("action", "opensearch"), ("search", query), ("limit", max_results), ("format", "json"))
+    )
 
     try:
         data = _http_get(url, ttl=_TTL_WIKI)
         titles = data[1]
+        summaries: list = []
+        if with_summaries and titles:
+            summaries = [
+                r.get("extract") if isinstance(r, dict) else None
+                for r in _http_get_many([_wiki_summary_url(t) for t in titles], ttl=_TTL_WIKI)
+            ]
         lines = [f"📖 **Wikipedia Results** for: **{query}**\n"]
         for i, title in enumerate(titles, 1):
             lines.append(f"{i}. {title}")
+            if summaries and summaries[i - 1]:
+                lines.append(f"   {summaries[i - 1]}\n")
         return "\n".join(lines)
     except Exception as e:
         return f"Wikipedia search failed: {e}"
 
 def wikipedia_article(title: str) -> str:
     """Fetch the full text of a Wikipedia article."""
-    encoded = urllib.parse.quote(title.replace(" ", "_"))
-    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{encoded}"
-
     try:
-        data = _http_get(url, ttl=_TTL_WIKI)
+        data = _http_get(_wiki_summary_url(title), ttl=_TTL_WIKI)
         return f"📖 **{data.get('title')}**\n\n{data.get('extract')}"
     except Exception as e:
         return f"Wikipedia article failed: {e}"
@@ -44,6 +60,7 @@ TOOLS = [
                 "type": "object",
                 "properties": {
                     "query": {"type": "string", "description": "Search query"},
+                    "with_summaries": {"type": "boolean", "description": "Also fetch each result's summary (fetched in parallel)"},
                 },
                 "required": ["query"],
             },
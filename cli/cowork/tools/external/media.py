@@ -3,24 +3,29 @@
 Implementations for TMDB (The Movie Database).
 """
 
+import io
 import urllib.parse
 from .utils import _env, _missing_key, _http_get, _TTL_METADATA
 
+_TMDB = "https://api.themoviedb.org/3/"
+_TMDB_SEARCH = _TMDB + "search/"
+
 def tmdb_search(query: str, media_type: str = "multi") -> str:
     """Search for movies/TV shows on TMDB."""
     api_key = _env("TMDB_API_KEY")
     if not api_key: return _missing_key("tmdb_search", "TMDB_API_KEY")
 
-    params = {"api_key": api_key, "query": query}
-    url = f"https://api.themoviedb.org/3/search/{media_type}?{urllib.parse.urlencode(params)}"
+    url = _TMDB_SEARCH + media_type + "?" + urllib.parse.urlencode((("api_key", api_key), ("query", query)))
 
     try:
         data = _http_get(url, ttl=_TTL_METADATA)
         results = data.get("results", [])
-        lines = [f"🎬 **TMDB Search** — '{query}'\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"🎬 **TMDB Search** — '{query}'\n")
         for i, res in enumerate(results[:5], 1):
-            lines.append(f"{i}. **{res.get('title') or res.get('name')}**\n   ID: {res.get('id')} | {res.get('overview')[:100]}...\n")
-        return "\n".join(lines)
+            w(f"\n{i}. **{res.get('title') or res.get('name')}**\n   ID: {res.get('id')} | {res.get('overview')[:100]}...\n")
+        return buf.getvalue()
     except Exception as e:
         return f"TMDB search failed: {e}"
 
@@ -29,7 +34,7 @@ def tmdb_details(tmdb_id: int, media_type: str = "movie") -> str:
     api_key = _env("TMDB_API_KEY")
     if not api_key: return _missing_key("tmdb_details", "TMDB_API_KEY")
 
-    url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}?api_key={api_key}"
+    url = f"{_TMDB}{media_type}/{tmdb_id}?api_key={api_key}"
 
     try:
         data = _http_get(url, ttl=_TTL_METADATA)
@@ -3,9 +3,13 @@
 Implementations for fetching news headlines using NewsAPI.
 """
 
+import io
 import urllib.parse
 from .utils import _env, _missing_key, _http_get, _TTL_NEWS
 
+_NEWS_EVERYTHING = "https://newsapi.org/v2/everything?"
+_NEWS_TOP = "https://newsapi.org/v2/top-headlines?"
+
 def newsapi_headlines(
     query: str = "",
     category: str = "",
@@ -18,23 +22,25 @@ def newsapi_headlines(
 
     params = {"apiKey": api_key, "pageSize": min(max_results, 20)}
     if query:
-        endpoint = "https://newsapi.org/v2/everything"
+        endpoint = _NEWS_EVERYTHING
         params["q"] = query
     else:
-        endpoint = "https://newsapi.org/v2/top-headlines"
+        endpoint = _NEWS_TOP
         params["country"] = country
         if category: params["category"] = category
 
-    url = f"{endpoint}?{urllib.parse.urlencode(params)}"
+    url = endpoint + urllib.parse.urlencode(params)
 
     try:
         data = _http_get(url, ttl=_TTL_NEWS)
         if data.get("status") != "ok": return f"NewsAPI error: {data.get('message')}"
         articles = data.get("articles", [])
-        lines = [f"📰 **News Headlines**\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w("📰 **News Headlines**\n")
         for i, art in enumerate(articles[:max_results], 1):
-            lines.append(f"{i}. **{art.get('title')}**\n   {art.get('source', {}).get('name')} | {art.get('publishedAt')[:10]}\n   URL: {art.get('url')}\n")
-        return "\n".join(lines)
+            w(f"\n{i}. **{art.get('title')}**\n   {art.get('source', {}).get('name')} | {art.get('publishedAt')[:10]}\n   URL: {art.get('url')}\n")
+        return buf.getvalue()
     except Exception as e:
         return f"NewsAPI failed: {e}"
 
@@ -3,6 +3,7 @@
 Implementations for Google Search (CSE & SerpAPI) and Brave Search.
 """
 
+import io
 import urllib.parse
 from .utils import _env, _missing_key, _http_get, _TTL_SEARCH
 
@@ -39,16 +40,18 @@ def google_cse_search(
         if error: return f"Google CSE error: {error.get('message')}"
 
         items = data.get("items", [])
-        lines = [f"🔍 **Google Search Results** for: **{query}**\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"🔍 **Google Search Results** for: **{query}**\n")
         if not items:
-            lines.append("No results found.")
+            w("\nNo results found.")
         else:
             for i, item in enumerate(items, 1):
                 title = item.get("title", "Untitled")
                 link = item.get("link", "")
                 snippet = item.get("snippet", "").replace("\n", " ")
-                lines.append(f"{i}. **{title}**\n   URL: {link}\n   {snippet}\n")
-        return "\n".join(lines)
+                w(f"\n{i}. **{title}**\n   URL: {link}\n   {snippet}\n")
+        return buf.getvalue()
     except Exception as e:
         return f"Google CSE search failed: {e}"
 
@@ -80,13 +83,15 @@ def google_search(
     try:
         data = _http_get(url, ttl=_TTL_SEARCH)
         organic = data.get("organic_results", [])
-        lines = [f"🔍 **Google Search Results** (via SerpAPI) for: **{query}**\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"🔍 **Google Search Results** (via SerpAPI) for: **{query}**\n")
         if not organic:
-            lines.append("No results found.")
+            w("\nNo results found.")
         else:
             for i, res in enumerate(organic[:num_results], 1):
-                lines.append(f"{i}. **{res.get('title')}**\n   URL: {res.get('link')}\n   {res.get('snippet')}\n")
-        return "\n".join(lines)
+                w(f"\n{i}. **{res.get('title')}**\n   URL: {res.get('link')}\n   {res.get('snippet')}\n")
+        return buf.getvalue()
     except Exception as e:
         return f"Google search (SerpAPI) failed: {e}"
 
@@ -109,10 +114,12 @@ def brave_search(
         data = _http_get(url, headers=headers, ttl=_TTL_SEARCH)
         results = data.get("web", {}).get("results", [])
         if not results: return f"No results for: '{query}'"
-        lines = [f"🦁 **Brave Search Results** for: **{query}**\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"🦁 **Brave Search Results** for: **{query}**\n")
         for i, res in enumerate(results[:num_results], 1):
-            lines.append(f"{i}. **{res.get('title')}**\n   URL: {res.get('url')}\n   {res.get('description')}\n")
-        return "\n".join(lines)
+            w(f"\n{i}. **{res.get('title')}**\n   URL: {res.get('url')}\n   {res.get('description')}\n")
+        return buf.getvalue()
     except Exception as e:
         return f"Brave search failed: {e}"
 
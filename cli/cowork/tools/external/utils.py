@@ -3,16 +3,43 @@
 Shared helpers for API integrations (HTTP, caching, keys).
 """
 
+import atexit
+import base64
 import hashlib
 import json
+import mmap
 import os
+import sqlite3
+import stat
+import threading
 import time
 import urllib.parse
-import urllib.request
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
+
+import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+def _json_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """UTF-8 JSON, via orjson (which emits bytes directly) when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+
 load_dotenv()
 
 # ─── Key Helpers ──────────────────────────────────────────────────────────────
@@ -21,16 +48,121 @@ def _env(key: str) -> Optional[str]:
     """Return env var value or None."""
     return os.environ.get(key) or None
 
+@lru_cache(maxsize=None)
+def _env_cached(key: str) -> Optional[str]:
+    """
+    _env() memoized for the process lifetime: keys are read once after
+    load_dotenv(), and _missing_key() already asks for a restart on change.
+    """
+    return _env(key)
+
 def _missing_key(tool_name: str, env_var: str) -> str:
     return (
         f"❌ Tool '{tool_name}' requires the `{env_var}` environment variable.\n"
         f"   Set it in your .env file and restart Cowork."
     )
 
+# ─── Frozen Schemas ───────────────────────────────────────────────────────────
+
+class _FrozenDict(dict):
+    """
+    Read-only dict for tool schemas. Stays a real dict so json encoding and
+    isinstance checks work, but can be shared without defensive copies.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("tool schemas are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __deepcopy__(self, memo: dict) -> "_FrozenDict":
+        return self
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into _FrozenDicts and lists into tuples."""
+    if isinstance(obj, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+# ─── Email Attachments ────────────────────────────────────────────────────────
+
+# Common attachment types as (main, sub) — skips mimetypes' database load and
+# the per-call split; anything else falls back to mimetypes.guess_type
+_EXT_MIME = {
+    ".pdf": ("application", "pdf"), ".zip": ("application", "zip"),
+    ".json": ("application", "json"), ".txt": ("text", "plain"),
+    ".csv": ("text", "csv"), ".html": ("text", "html"), ".md": ("text", "markdown"),
+    ".png": ("image", "png"), ".jpg": ("image", "jpeg"), ".jpeg": ("image", "jpeg"),
+    ".gif": ("image", "gif"), ".webp": ("image", "webp"),
+    ".doc": ("application", "msword"),
+    ".docx": ("application", "vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    ".xlsx": ("application", "vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ".pptx": ("application", "vnd.openxmlformats-officedocument.presentationml.presentation"),
+    ".mp3": ("audio", "mpeg"), ".mp4": ("video", "mp4"),
+}
+
+
+def _attachment_mime(path: Path) -> tuple[str, str]:
+    known = _EXT_MIME.get(path.suffix.lower())
+    if known:
+        return known
+    import mimetypes
+
+    mime_type, _ = mimetypes.guess_type(path.name)
+    if mime_type:
+        main_type, sub_type = mime_type.split("/", 1)
+        return main_type, sub_type
+    return "application", "octet-stream"
+
+
+def _load_attachment(path_str: str) -> tuple[Optional[tuple[Path, str, str, str]], Optional[str]]:
+    """
+    Read and base64-encode one email attachment (safe to run off the main thread).
+    Returns ((path, main_type, sub_type, payload), None) or (None, error).
+    """
+    path = Path(path_str.strip()).expanduser()
+    try:
+        st = path.stat()
+    except OSError:
+        return None, f"File not found: {path}"
+    if not stat.S_ISREG(st.st_mode):
+        return None, f"Not a file: {path}"
+
+    main_type, sub_type = _attachment_mime(path)
+
+    try:
+        # Encode straight from a read-only mapping: no bytes copy of the file,
+        # and no decode/re-encode round trip through encoders.encode_base64.
+        # encodebytes() already emits RFC 2045 76-column lines.
+        if st.st_size:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+                    # Start kernel readahead for the whole file up front
+                    mm.madvise(mmap.MADV_WILLNEED)
+                payload = base64.encodebytes(mm).decode("ascii")
+        else:
+            payload = ""
+    except Exception as e:
+        return None, f"Could not attach {path.name}: {e}"
+    return (path, main_type, sub_type, payload), None
+
+def _load_attachments(paths: list[str]) -> list[tuple[Optional[tuple[Path, str, str, str]], Optional[str]]]:
+    """_load_attachment over several files, reads overlapped on a small pool, input order kept."""
+    if len(paths) <= 1:
+        return [_load_attachment(p) for p in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(pool.map(_load_attachment, paths))
+
 # ─── Disk-Based TTL Cache ─────────────────────────────────────────────────────
 
-_CACHE_DIR = Path.home() / ".cowork" / "api_cache"
-_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# One SQLite file (WAL) instead of a JSON file per key: a lookup is one indexed
+# read, entries survive across CLI runs, and large bodies are stored zlib-compressed.
+_CACHE_DB = Path.home() / ".cowork" / "api_cache.db"
 
 _TTL_SEARCH   = 3600
 _TTL_NEWS     = 1800
@@ -40,32 +172,212 @@ _TTL_WIKI     = 86400 * 7
 _TTL_GITHUB   = 3600
 _TTL_DEFAULT  = 3600
 
+_db: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()
+
+def _cache_db() -> sqlite3.Connection:
+    """Shared connection, opened on first use; callers hold _db_lock."""
+    global _db
+    if _db is None:
+        _CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(_CACHE_DB), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            " key TEXT PRIMARY KEY, ts REAL NOT NULL, etag TEXT, body BLOB NOT NULL)"
+        )
+        _db = conn
+    return _db
+
+# Bodies at or under this size are stored as plain JSON: compressing them saves
+# little and costs a zlib pass on every write and read
+_COMPRESS_MIN = 16384
+
 def _cache_key(url: str, payload: dict | None = None) -> str:
-    raw = url + (json.dumps(payload, sort_keys=True) if payload else "")
-    return hashlib.sha256(raw.encode()).hexdigest()
+    # Only an index key, so no need for SHA-256: 128-bit BLAKE2b is plenty
+    # for a cache namespace and cheaper per call
+    h = hashlib.blake2b(url.encode(), digest_size=16)
+    if payload:
+        h.update(_json_bytes(payload, sort_keys=True))
+    return h.hexdigest()
 
-def _cache_get(key: str, ttl: int) -> dict | str | None:
-    path = _CACHE_DIR / f"{key}.json"
-    if not path.exists():
+# Hot records kept decoded in memory (LRU, guarded by _db_lock) in front of the
+# SQLite store: a repeat lookup skips the query, decompress and JSON parse.
+_MEM: "OrderedDict[str, dict]" = OrderedDict()
+_MEM_MAX = 1024
+
+def _mem_put(key: str, record: dict) -> None:
+    _MEM[key] = record
+    _MEM.move_to_end(key)
+    if len(_MEM) > _MEM_MAX:
+        _MEM.popitem(last=False)
+
+def _cache_entry(key: str) -> dict | None:
+    """Raw cache record ({"ts", "value", optional "etag"}), fresh or not."""
+    try:
+        with _db_lock:
+            record = _MEM.get(key)
+            if record is not None:
+                _MEM.move_to_end(key)
+                return record
+            row = _cache_db().execute(
+                "SELECT ts, etag, body FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body = row[2]
+            # zlib streams start with 0x78 ('x'), which no JSON document can
+            if body[:1] == b"x":
+                body = zlib.decompress(body)
+            record = {"ts": row[0], "value": _json_loads(body)}
+            if row[1]:
+                record["etag"] = row[1]
+            _mem_put(key, record)
+            return record
+    except Exception:
         return None
+
+def _cache_get(key: str, ttl: int) -> dict | str | None:
+    data = _cache_entry(key)
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        if time.time() - data["ts"] < ttl:
+        if data and time.time() - data["ts"] < ttl:
             return data["value"]
     except Exception:
         pass
     return None
 
-def _cache_set(key: str, value: dict | str) -> None:
-    path = _CACHE_DIR / f"{key}.json"
+def _cache_set(key: str, value: dict | str, etag: str | None = None) -> None:
+    ts = time.time()
+    record = {"ts": ts, "value": value}
+    if etag:
+        record["etag"] = etag
     try:
-        path.write_text(
-            json.dumps({"ts": time.time(), "value": value}, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        body = _json_bytes(value)
+        if len(body) > _COMPRESS_MIN:
+            body = zlib.compress(body, 1)
+        with _db_lock:
+            _mem_put(key, record)
+            _cache_db().execute(
+                "INSERT OR REPLACE INTO http_cache (key, ts, etag, body) VALUES (?, ?, ?, ?)",
+                (key, ts, etag, body),
+            )
     except Exception:
         pass
 
+# ─── Shared HTTP Client ───────────────────────────────────────────────────────
+
+# One pooled client for every external tool: keep-alive connections mean repeat
+# calls to the same API host skip the TCP + TLS handshake.
+_CLIENT: Optional[httpx.Client] = None
+# Sent on every request; per-call headers are merged over these by the client
+_DEFAULT_HEADERS = {"User-Agent": "CoworkCLI/1.0"}
+_client_lock = threading.Lock()
+# Worker threads for _http_get_many, created on first batch
+_FETCH_POOL = None
+
+def _http_client() -> httpx.Client:
+    global _CLIENT
+    if _CLIENT is None:
+        with _client_lock:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        retries=2,
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                    ),
+                    headers=_DEFAULT_HEADERS,
+                    follow_redirects=True,
+                )
+    return _CLIENT
+
+@atexit.register
+def _close_http_client() -> None:
+    global _CLIENT
+    with _client_lock:
+        if _CLIENT is not None:
+            _CLIENT.close()
+            _CLIENT = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transient statuses worth retrying for idempotent GETs, with backoff base (s)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_GET_RETRIES = 2
+_RETRY_BACKOFF = 0.2
+
+def _decode_body(content: bytes) -> dict | str:
+    """
+    JSON straight from the response bytes (orjson when installed), without
+    materializing a str first; non-JSON bodies come back as lenient text.
+    """
+    try:
+        return _json_loads(content)
+    except ValueError:
+        raw = content.decode("utf-8", errors="ignore")
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return raw
+
+# Cache key → Future of the request currently fetching it. Concurrent misses on
+# the same key (parallel tool calls, several agents) share one upstream request
+# instead of each spending quota on a duplicate.
+_INFLIGHT: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Cache key → (expiry, error) for recent HTTP error responses. A bad video id or
+# unknown city is answered from here for a couple of seconds instead of
+# re-hitting (and re-spending quota on) the upstream. In-process only: entries
+# this short-lived aren't worth a disk write.
+_NEG_TTL = 2.0
+_NEG_MAX = 256
+_NEGATIVE: dict[str, tuple[float, Exception]] = {}
+
+def _neg_get(key: str) -> Optional[Exception]:
+    hit = _NEGATIVE.get(key)
+    if hit is None:
+        return None
+    if hit[0] > time.monotonic():
+        return hit[1]
+    _NEGATIVE.pop(key, None)
+    return None
+
+def _neg_set(key: str, error: Exception) -> None:
+    now = time.monotonic()
+    if len(_NEGATIVE) >= _NEG_MAX:
+        for k in [k for k, (exp, _) in list(_NEGATIVE.items()) if exp <= now]:
+            _NEGATIVE.pop(k, None)
+        if len(_NEGATIVE) >= _NEG_MAX:
+            _NEGATIVE.clear()
+    _NEGATIVE[key] = (now + _NEG_TTL, error)
+
+def _is_transient(error: Exception) -> bool:
+    """Upstream unavailable (network, 429, 5xx) as opposed to a definitive answer."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRY_STATUSES
+    return isinstance(error, httpx.TransportError)
+
+def _singleflight(key: str, fetch):
+    with _inflight_lock:
+        fut = _INFLIGHT.get(key)
+        leader = fut is None
+        if leader:
+            fut = _INFLIGHT[key] = Future()
+    if not leader:
+        return fut.result()
+    try:
+        result = fetch()
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _INFLIGHT.pop(key, None)
+
 def _http_get(
     url: str,
     headers: dict | None = None,
@@ -73,19 +385,82 @@ def _http_get(
     ttl: int = _TTL_DEFAULT,
 ) -> dict | str:
     ck = _cache_key(url)
-    cached = _cache_get(ck, ttl)
-    if cached is not None:
-        return cached
-    req = urllib.request.Request(url, headers=headers or {"User-Agent": "CoworkCLI/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read().decode("utf-8", errors="ignore")
+    entry = _cache_entry(ck)
+    if entry is not None:
+        try:
+            if time.time() - entry["ts"] < ttl:
+                return entry["value"]
+        except Exception:
+            entry = None
+    neg = _neg_get(ck)
+    if neg is not None:
+        raise neg
+    return _singleflight(ck, lambda: _fetch_get(ck, url, headers, timeout, entry))
+
+def _fetch_get(ck: str, url: str, headers: dict | None, timeout: int, entry: dict | None) -> dict | str:
+    """
+    Network half of _http_get: conditional, retried GET, then cache write.
+    If the upstream is unavailable, a stale cached value beats an error;
+    definitive error responses are negatively cached for _NEG_TTL.
+    """
+    req_headers = headers
+    etag = entry.get("etag") if entry else None
+    if etag:
+        # Stale but validatable: a 304 lets us keep the cached body without a re-download
+        req_headers = {**headers, "If-None-Match": etag} if headers else {"If-None-Match": etag}
+    client = _http_client()
     try:
-        result: dict | str = json.loads(raw)
-    except json.JSONDecodeError:
-        result = raw
-    _cache_set(ck, result)
+        for attempt in range(_GET_RETRIES + 1):
+            resp = client.get(url, headers=req_headers, timeout=timeout)
+            if resp.status_code not in _RETRY_STATUSES or attempt == _GET_RETRIES:
+                break
+            time.sleep(_RETRY_BACKOFF * (2 ** attempt))
+        if resp.status_code == 304 and entry is not None:
+            _cache_set(ck, entry["value"], etag)
+            return entry["value"]
+        resp.raise_for_status()
+    except httpx.HTTPError as e:
+        if entry is not None and _is_transient(e):
+            return entry["value"]
+        if isinstance(e, httpx.HTTPStatusError):
+            _neg_set(ck, e)
+        raise
+    etag = resp.headers.get("ETag")
+    result = _decode_body(resp.content)
+    _cache_set(ck, result, etag)
     return result
 
+def _fetch_pool():
+    global _FETCH_POOL
+    if _FETCH_POOL is None:
+        with _client_lock:
+            if _FETCH_POOL is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _FETCH_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="http-get")
+    return _FETCH_POOL
+
+def _http_get_many(
+    urls: list[str],
+    headers: dict | None = None,
+    timeout: int = 15,
+    ttl: int = _TTL_DEFAULT,
+) -> list[dict | str | Exception]:
+    """
+    _http_get over several URLs at once on a shared pool, so N independent
+    fetches cost about one round trip. Results keep input order; a failed
+    fetch yields its exception instead of aborting the batch.
+    """
+    def fetch(url: str) -> dict | str | Exception:
+        try:
+            return _http_get(url, headers=headers, timeout=timeout, ttl=ttl)
+        except Exception as e:
+            return e
+
+    if len(urls) <= 1:
+        return [fetch(u) for u in urls]
+    return list(_fetch_pool().map(fetch, urls))
+
 def _http_post(
     url: str,
     payload: dict,
@@ -97,19 +472,21 @@ def _http_post(
     cached = _cache_get(ck, ttl)
     if cached is not None:
         return cached
-    body = json.dumps(payload).encode("utf-8")
-    default_headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "CoworkCLI/1.0",
-    }
-    if headers:
-        default_headers.update(headers)
-    req = urllib.request.Request(url, data=body, headers=default_headers, method="POST")
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read().decode("utf-8", errors="ignore")
-    try:
-        result: dict | str = json.loads(raw)
-    except json.JSONDecodeError:
-        result = raw
-    _cache_set(ck, result)
-    return result
+    neg = _neg_get(ck)
+    if neg is not None:
+        raise neg
+
+    def fetch() -> dict | str:
+        body = json.dumps(payload).encode("utf-8")
+        req_headers = {"Content-Type": "application/json", **headers} if headers else _JSON_HEADERS
+        resp = _http_client().post(url, content=body, headers=req_headers, timeout=timeout)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            _neg_set(ck, e)
+            raise
+        result = _decode_body(resp.content)
+        _cache_set(ck, result)
+        return result
+
+    return _singleflight(ck, fetch)
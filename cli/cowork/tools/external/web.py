@@ -3,8 +3,15 @@
 Implementations for scraping and crawling using Firecrawl.
 """
 
+import io
 import time
-from .utils import _env, _missing_key, _http_get, _http_post, _TTL_DEFAULT
+from .utils import _env, _missing_key, _http_client, _http_post, _decode_body, _RETRY_STATUSES
+
+# firecrawl_crawl status polling: first wait, growth factor, cap, overall deadline (s)
+_POLL_INITIAL = 0.5
+_POLL_FACTOR = 1.7
+_POLL_MAX = 5.0
+_POLL_TIMEOUT = 60.0
 
 def firecrawl_scrape(
     url: str,
@@ -47,15 +54,30 @@ def firecrawl_crawl(
         job_id = data.get("id")
         if not job_id: return "No job ID returned."
 
-        for _ in range(10):
-            time.sleep(3)
-            status_data = _http_get(f"https://api.firecrawl.dev/v1/crawl/{job_id}", headers=headers)
+        # Poll with backoff (0.5s growing to 5s) instead of a fixed 3s step, so a
+        # quick crawl returns in well under a second. Job status is polled on the
+        # pooled client directly, bypassing the response cache: it is one-off and
+        # must never be persisted or replayed. Re-running the same crawl within the
+        # POST cache TTL reuses this job id rather than starting anew.
+        status_url = f"https://api.firecrawl.dev/v1/crawl/{job_id}"
+        delay = _POLL_INITIAL
+        deadline = time.monotonic() + _POLL_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(delay * _POLL_FACTOR, _POLL_MAX)
+            resp = _http_client().get(status_url, headers=headers, timeout=15)
+            if resp.status_code in _RETRY_STATUSES:
+                continue
+            resp.raise_for_status()
+            status_data = _decode_body(resp.content)
             if status_data.get("status") == "completed":
                 pages = status_data.get("data", [])
-                lines = [f"🔥 **Firecrawl Crawl** — {url}\n"]
+                buf = io.StringIO()
+                w = buf.write
+                w(f"🔥 **Firecrawl Crawl** — {url}\n")
                 for i, p in enumerate(pages[:max_pages], 1):
-                    lines.append(f"### {i}. {p.get('metadata', {}).get('title')}\n{p.get('markdown', '')[:1000]}\n")
-                return "\n".join(lines)
+                    w(f"\n### {i}. {p.get('metadata', {}).get('title')}\n{p.get('markdown', '')[:1000]}\n")
+                return buf.getvalue()
         return "Crawl timed out."
     except Exception as e:
         return f"Firecrawl crawl failed: {e}"
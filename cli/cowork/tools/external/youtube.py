@@ -3,10 +3,22 @@
 Implementations for searching and getting metadata/transcripts from YouTube.
 """
 
+import io
 import re
 import urllib.parse
+from typing import Optional
 from .utils import _env, _missing_key, _http_get, _TTL_SEARCH, _TTL_METADATA
 
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})")
+_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+def _extract_video_id(video_id: str) -> Optional[str]:
+    """Bare ID from a youtube.com / youtu.be URL; other input is returned as-is, None if unparseable."""
+    if "youtube.com" in video_id or "youtu.be" in video_id:
+        match = _VIDEO_ID_RE.search(video_id)
+        return match.group(1) if match else None
+    return video_id
+
 def youtube_search(
     query: str,
     max_results: int = 5,
@@ -40,7 +52,9 @@ def youtube_search(
         if not items:
             return f"No YouTube results found for: '{query}'"
 
-        lines = [f"🎬 YouTube Search Results for: **{query}**\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"🎬 YouTube Search Results for: **{query}**\n")
         for i, item in enumerate(items, 1):
             snippet = item.get("snippet", {})
             video_id = item.get("id", {}).get("videoId", "")
@@ -49,13 +63,13 @@ def youtube_search(
             published = snippet.get("publishedAt", "")[:10]
             description = snippet.get("description", "")[:150]
             url_video = f"https://www.youtube.com/watch?v={video_id}"
-            lines.append(
-                f"{i}. **{title}**\n"
+            w(
+                f"\n{i}. **{title}**\n"
                 f"   Channel: {channel} | Published: {published}\n"
                 f"   URL: {url_video}\n"
                 f"   {description}...\n"
             )
-        return "\n".join(lines)
+        return buf.getvalue()
 
     except Exception as e:
         return f"YouTube search failed: {e}"
@@ -68,12 +82,10 @@ def youtube_transcript(
     Fetch the transcript/captions of a YouTube video.
     No API key needed (uses youtube-transcript-api).
     """
-    if "youtube.com" in video_id or "youtu.be" in video_id:
-        match = re.search(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})", video_id)
-        if match:
-            video_id = match.group(1)
-        else:
-            return f"Could not extract video ID from URL: {video_id}"
+    extracted = _extract_video_id(video_id)
+    if extracted is None:
+        return f"Could not extract video ID from URL: {video_id}"
+    video_id = extracted
 
     try:
         from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore
@@ -100,72 +112,95 @@ def youtube_transcript(
     except Exception as e:
         return f"Transcript fetch failed for '{video_id}': {e}"
 
-def youtube_metadata(video_id: str) -> str:
+_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos?"
+_VIDEOS_MAX_IDS = 50  # videos.list accepts up to 50 comma-separated ids per call
+
+def _format_metadata(item: dict, video_id: str) -> str:
+    snippet = item.get("snippet", {})
+    stats = item.get("statistics", {})
+    details = item.get("contentDetails", {})
+
+    title = snippet.get("title", "Unknown")
+    channel = snippet.get("channelTitle", "Unknown")
+    published = snippet.get("publishedAt", "")[:10]
+    description = snippet.get("description", "")[:500]
+    duration = details.get("duration", "PT0S")
+    views = stats.get("viewCount", "0")
+    likes = stats.get("likeCount", "0")
+    comments = stats.get("commentCount", "0")
+
+    dur_match = _DURATION_RE.match(duration)
+    if dur_match:
+        h, m, s = (int(x or 0) for x in dur_match.groups())
+        duration_str = f"{h}h {m}m {s}s" if h else f"{m}m {s}s"
+    else:
+        duration_str = duration
+
+    return (
+        f"📹 **YouTube Video Metadata**\n\n"
+        f"**Title**: {title}\n"
+        f"**Channel**: {channel}\n"
+        f"**Published**: {published}\n"
+        f"**Duration**: {duration_str}\n"
+        f"**Views**: {int(views):,}\n"
+        f"**Likes**: {int(likes):,}\n"
+        f"**Comments**: {int(comments):,}\n"
+        f"**URL**: https://www.youtube.com/watch?v={video_id}\n\n"
+        f"**Description**:\n{description}..."
+    )
+
+def youtube_metadata_batch(video_ids: list[str]) -> list[str]:
     """
-    Fetch detailed metadata for a YouTube video.
+    Metadata for several videos, one formatted result per input in input order.
+    IDs are deduplicated and fetched 50 per videos.list call, so N videos cost
+    ceil(N/50) requests (and quota units) instead of N.
     Requires: YOUTUBE_API_KEY
     """
     api_key = _env("YOUTUBE_API_KEY")
     if not api_key:
-        return _missing_key("youtube_metadata", "YOUTUBE_API_KEY")
-
-    if "youtube.com" in video_id or "youtu.be" in video_id:
-        match = re.search(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})", video_id)
-        if match:
-            video_id = match.group(1)
-
-    params = urllib.parse.urlencode({
-        "part": "snippet,statistics,contentDetails",
-        "id": video_id,
-        "key": api_key,
-    })
-    url = f"https://www.googleapis.com/youtube/v3/videos?{params}"
-
-    try:
-        data = _http_get(url, ttl=_TTL_METADATA)
-        if isinstance(data, str):
-            return f"YouTube API error: {data[:500]}"
+        return [_missing_key("youtube_metadata", "YOUTUBE_API_KEY")] * len(video_ids)
 
-        items = data.get("items", [])
-        if not items:
-            return f"No video found with ID: '{video_id}'"
-
-        item = items[0]
-        snippet = item.get("snippet", {})
-        stats = item.get("statistics", {})
-        details = item.get("contentDetails", {})
-
-        title = snippet.get("title", "Unknown")
-        channel = snippet.get("channelTitle", "Unknown")
-        published = snippet.get("publishedAt", "")[:10]
-        description = snippet.get("description", "")[:500]
-        tags = snippet.get("tags", [])
-        duration = details.get("duration", "PT0S")
-        views = stats.get("viewCount", "0")
-        likes = stats.get("likeCount", "0")
-        comments = stats.get("commentCount", "0")
-
-        dur_match = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", duration)
-        if dur_match:
-            h, m, s = (int(x or 0) for x in dur_match.groups())
-            duration_str = f"{h}h {m}m {s}s" if h else f"{m}m {s}s"
-        else:
-            duration_str = duration
+    ids = [_extract_video_id(v) or v for v in video_ids]
+    unique = list(dict.fromkeys(ids))
+    results: dict[str, str] = {}
+    for i in range(0, len(unique), _VIDEOS_MAX_IDS):
+        chunk = unique[i:i + _VIDEOS_MAX_IDS]
+        url = _VIDEOS_URL + urllib.parse.urlencode({
+            "part": "snippet,statistics,contentDetails",
+            "id": ",".join(chunk),
+            "key": api_key,
+        })
+        try:
+            data = _http_get(url, ttl=_TTL_METADATA)
+            if isinstance(data, str):
+                error = f"YouTube API error: {data[:500]}"
+                results.update((vid, error) for vid in chunk)
+                continue
+            by_id = {item.get("id"): item for item in data.get("items", [])}
+            for vid in chunk:
+                item = by_id.get(vid)
+                if item is None:
+                    results[vid] = f"No video found with ID: '{vid}'"
+                    continue
+                try:
+                    results[vid] = _format_metadata(item, vid)
+                except Exception as e:
+                    results[vid] = f"YouTube metadata fetch failed: {e}"
+        except Exception as e:
+            results.update((vid, f"YouTube metadata fetch failed: {e}") for vid in chunk)
+    return [results[vid] for vid in ids]
 
-        return (
-            f"📹 **YouTube Video Metadata**\n\n"
-            f"**Title**: {title}\n"
-            f"**Channel**: {channel}\n"
-            f"**Published**: {published}\n"
-            f"**Duration**: {duration_str}\n"
-            f"**Views**: {int(views):,}\n"
-            f"**Likes**: {int(likes):,}\n"
-            f"**Comments**: {int(comments):,}\n"
-            f"**URL**: https://www.youtube.com/watch?v={video_id}\n\n"
-            f"**Description**:\n{description}..."
-        )
-    except Exception as e:
-        return f"YouTube metadata fetch failed: {e}"
+def youtube_metadata(video_id: str = "", video_ids: Optional[list[str]] = None) -> str:
+    """
+    Fetch detailed metadata for a YouTube video, or for several at once via video_ids.
+    Requires: YOUTUBE_API_KEY
+    """
+    targets = list(video_ids or [])
+    if video_id:
+        targets.insert(0, video_id)
+    if not targets:
+        return "No video ID given."
+    return "\n\n---\n\n".join(youtube_metadata_batch(targets))
 
 TOOLS = [
     {
@@ -215,8 +250,13 @@ TOOLS = [
                 "type": "object",
                 "properties": {
                     "video_id": {"type": "string", "description": "YouTube video URL or video ID"},
+                    "video_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Several video URLs/IDs, fetched together in one request",
+                    },
                 },
-                "required": ["video_id"],
+                "required": [],
             },
         },
     },
@@ -104,6 +104,7 @@ class WorkspaceSession:
         self.metadata:  dict = {}
 
         self._dir = WORKSPACE_ROOT / slug
+        self._listings: dict[str, tuple[int, set[str]]] = {}  # subdir → (mtime_ns, file names)
         self._ensure_dirs()
 
     # ── Directory Setup ───────────────────────────────────────────────────────
@@ -134,6 +135,48 @@ class WorkspaceSession:
     def artifacts_path(self) -> Path:
         return self._dir / self.ARTIFACTS_DIR
 
+    def _file_names(self, subdir: str, revalidate: bool = False) -> set[str]:
+        """
+        File names in one of the session subfolders, from a single scandir.
+        The cached set is trusted as-is unless `revalidate` is set, in which
+        case the folder's mtime decides whether it is rescanned.
+        """
+        cached = self._listings.get(subdir)
+        if cached is not None and not revalidate:
+            return cached[1]
+        path = self._dir / subdir
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return set()
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with os.scandir(path) as it:
+            names = {e.name for e in it if e.is_file()}
+        self._listings[subdir] = (mtime, names)
+        return names
+
+    def find_file(self, subdir: str, name: str) -> Optional[Path]:
+        """
+        Path of `name` inside `subdir` if it exists there. Hits come from the
+        cached listing with no stat; misses revalidate the listing once, so
+        files written by other tools are still found.
+        """
+        if name in self._file_names(subdir) or name in self._file_names(subdir, revalidate=True):
+            return self._dir / subdir / name
+        return None
+
+    def forget_file(self, subdir: str, name: str) -> None:
+        """Drop `name` from the cached listing (e.g. it vanished underneath us)."""
+        cached = self._listings.get(subdir)
+        if cached is not None:
+            cached[1].discard(name)
+
+    def _remember_file(self, subdir: str, name: str) -> None:
+        cached = self._listings.get(subdir)
+        if cached is not None:
+            cached[1].add(name)
+
     # ── Serialization ─────────────────────────────────────────────────────────
 
     def to_dict(self) -> dict:
@@ -269,6 +312,7 @@ class WorkspaceSession:
         note_path = self.notes_path / filename
         header = f"# {title}\n\n**Category:** {category}  \n**Created:** {datetime.utcnow().isoformat()}\n\n---\n\n"
         note_path.write_text(header + content, encoding="utf-8")
+        self._remember_file(self.NOTES_DIR, filename)
         return str(note_path)
 
     # ── Artifacts ─────────────────────────────────────────────────────────────
@@ -279,6 +323,7 @@ class WorkspaceSession:
         safe_name = Path(filename).name  # strip any path traversal
         artifact_path = self.artifacts_path / safe_name
         artifact_path.write_text(content, encoding="utf-8")
+        self._remember_file(self.ARTIFACTS_DIR, safe_name)
         return str(artifact_path)
 
     def list_artifacts(self) -> list[dict]:
@@ -295,6 +340,13 @@ class WorkspaceSession:
         return results
 
 
+# ─── Session Cache ────────────────────────────────────────────────────────────
+# session_id → loaded WorkspaceSession, so tools resolving their session on every
+# call skip the directory scan + session.json parse. Evicted by the manager on
+# rename/delete.
+_SESSION_CACHE: dict[str, WorkspaceSession] = {}
+
+
 # ─── Workspace Manager ────────────────────────────────────────────────────────
 
 class WorkspaceManager:
@@ -305,9 +357,20 @@ class WorkspaceManager:
 
     def __init__(self) -> None:
         WORKSPACE_ROOT.mkdir(parents=True, exist_ok=True)
+        self._by_session_id: Optional[dict[str, str]] = None  # session_id → slug, built lazily
+        # (root st_mtime_ns, slugs): adding/removing a session folder bumps the root mtime
+        self._slugs: Optional[tuple[int, set[str]]] = None
+        # slug → ((session.json st_mtime_ns, st_size), list_all() summary)
+        self._summaries: dict[str, tuple[tuple[int, int], dict]] = {}
 
     def _existing_slugs(self) -> set[str]:
-        return {p.name for p in WORKSPACE_ROOT.iterdir() if p.is_dir() and not p.name.startswith(".")}
+        mtime = WORKSPACE_ROOT.stat().st_mtime_ns
+        cached = self._slugs
+        if cached is None or cached[0] != mtime:
+            with os.scandir(WORKSPACE_ROOT) as it:
+                slugs = {e.name for e in it if not e.name.startswith(".") and e.is_dir()}
+            cached = self._slugs = (mtime, slugs)
+        return set(cached[1])
 
     def create(self, title: str = "New Session") -> WorkspaceSession:
         """Create a new workspace session with a human-readable slug."""
@@ -326,8 +389,26 @@ class WorkspaceManager:
             f"*This file is your session's living context. The agent can read and update it.*\n"
         )
         ws.save()
+        self._slugs = None
+        if self._by_session_id is not None:
+            self._by_session_id[session_id] = slug
         return ws
 
+    def get_slug_by_session_id(self, session_id: str) -> Optional[str]:
+        """
+        Slug of the workspace linked to `session_id`. Served from an in-memory
+        index; rebuilt from disk on a miss or when the indexed folder is gone
+        (first use, or sessions created/moved by another process).
+        """
+        index = self._by_session_id
+        slug = index.get(session_id) if index is not None else None
+        if slug is None or not (WORKSPACE_ROOT / slug).is_dir():
+            index = self._by_session_id = {
+                s["session_id"]: s["slug"] for s in self.list_all() if s["session_id"]
+            }
+            slug = index.get(session_id)
+        return slug
+
     def load(self, slug_or_id: str) -> Optional[WorkspaceSession]:
         """Load a session by slug or session_id prefix."""
         # Try direct slug first
@@ -341,34 +422,58 @@ class WorkspaceManager:
                 return ws
         return None
 
-    def list_all(self) -> list[dict]:
-        """List all workspace sessions, sorted by last modified."""
+    def list_all(self, limit: Optional[int] = None) -> list[dict]:
+        """
+        List all workspace sessions, sorted by last modified (at most `limit`).
+        A session.json is only re-parsed when its mtime or size changed since
+        the last listing.
+        """
         sessions = []
+        summaries: dict[str, tuple[tuple[int, int], dict]] = {}
         for slug in self._existing_slugs():
             meta_path = WORKSPACE_ROOT / slug / "session.json"
-            if not meta_path.exists():
-                continue
             try:
-                with open(meta_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                sessions.append({
-                    "slug":          data.get("slug", slug),
-                    "session_id":    data.get("session_id", ""),
-                    "title":         data.get("title", "Untitled"),
-                    "created_at":    data.get("created_at", ""),
-                    "updated_at":    data.get("updated_at", ""),
-                    "message_count": len(data.get("messages", [])),
-                    "path":          str(WORKSPACE_ROOT / slug),
-                })
-            except Exception:
-                pass
-        return sorted(sessions, key=lambda s: s.get("updated_at", ""), reverse=True)
+                st = meta_path.stat()
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._summaries.get(slug)
+            if cached is not None and cached[0] == stamp:
+                summary = cached[1]
+            else:
+                try:
+                    with open(meta_path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    summary = {
+                        "slug":          data.get("slug", slug),
+                        "session_id":    data.get("session_id", ""),
+                        "title":         data.get("title", "Untitled"),
+                        "created_at":    data.get("created_at", ""),
+                        "updated_at":    data.get("updated_at", ""),
+                        "message_count": len(data.get("messages", [])),
+                        "path":          str(WORKSPACE_ROOT / slug),
+                    }
+                except Exception:
+                    continue
+            summaries[slug] = (stamp, summary)
+            sessions.append(summary)
+        self._summaries = summaries
+        sessions.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
+        return sessions[:limit] if limit is not None else sessions
+
+    def invalidate(self, session_id: Optional[str] = None) -> None:
+        """Evict a cached session (or all of them when session_id is None)."""
+        if session_id is None:
+            _SESSION_CACHE.clear()
+        else:
+            _SESSION_CACHE.pop(session_id, None)
 
     def rename(self, slug: str, new_title: str) -> Optional[WorkspaceSession]:
         """Rename a session (updates title + renames folder if slug changes)."""
         ws = WorkspaceSession.load(slug)
         if not ws:
             return None
+        self.invalidate(ws.session_id)
         existing = self._existing_slugs() - {slug}
         new_slug = _unique_slug(new_title, existing)
         ws.title = new_title
@@ -377,14 +482,23 @@ class WorkspaceManager:
             shutil.move(str(ws.path), str(new_path))
             ws.slug = new_slug
             ws._dir = new_path
+            self._slugs = None
         ws.save()
+        if self._by_session_id is not None:
+            self._by_session_id[ws.session_id] = ws.slug
         return ws
 
     def delete(self, slug: str) -> bool:
         """Delete a workspace session folder."""
         path = WORKSPACE_ROOT / slug
+        for session_id, ws in list(_SESSION_CACHE.items()):
+            if ws.slug == slug:
+                self.invalidate(session_id)
+        if self._by_session_id is not None:
+            self._by_session_id = {k: v for k, v in self._by_session_id.items() if v != slug}
         if path.exists():
             shutil.rmtree(path)
+            self._slugs = None
             return True
         return False
 